@@ -39,15 +39,12 @@ class CatalogBuilder:
         """Record a failed file."""
         self.failed.append({"file": file_path, "error": error})
 
-    def write(self, output_path: str):
-        """Write catalog.json to disk.
+    def to_dict(self) -> dict:
+        """Return the catalog as a JSON-ready dict.
 
-        Creates parent directories if they don't exist.  The output
-        follows the camelCase JSON schema expected by the web UI.
+        The output follows the camelCase JSON schema expected by the web UI.
         """
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-
-        catalog = {
+        return {
             "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
             "total_items": len(self.items),
             "total_failed": len(self.failed),
@@ -73,6 +70,15 @@ class CatalogBuilder:
             },
         }
 
+    def write(self, output_path: str):
+        """Write catalog.json to disk.
+
+        Creates parent directories if they don't exist.  See
+        :meth:`to_dict` for the schema.
+        """
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        catalog = self.to_dict()
+
         with open(output_path, "w", encoding="utf-8") as f:
             json.dump(catalog, f, indent=2, ensure_ascii=False)
             f.write("\n")
@@ -79,8 +79,12 @@ PROP_DISPLAY_NAMES: dict[str, str] = {
 
 
 def is_prop_category(category: str) -> bool:
-    """Return True if the category is a prop (p_head, p_eyes, etc.)."""
-    return category in PROP_CATEGORIES
+    """Return True if the category is a prop (p_head, p_eyes, etc.).
+
+    Every prop category has ``_`` as its second character, so plain
+    clothing keys (accs, jbib, ...) are rejected before the set probe.
+    """
+    return len(category) >= 3 and category[1] == "_" and category in PROP_CATEGORIES
 
 
 def prop_display_name(category: str) -> str:
@@ -118,10 +122,14 @@ def category_display_name(category: str) -> str:
     return CATEGORY_DISPLAY_NAMES.get(category, category)
 
 
-@dataclass
+@dataclass(slots=True)
 class YtdFileInfo:
-    """Parsed metadata from a .ytd texture filename."""
-    file_path: str
+    """Parsed metadata from a .ytd texture filename.
+
+    Field order matches the tuple built by the parser branches so
+    instances can be created positionally (or via :meth:`_make`)
+    without keyword-argument overhead.
+    """
     model: str          # "mp_f_freemode_01" or custom ped name
     dlc_name: str       # "rhclothing", or model name for custom peds
     gender: str         # "female", "male", or "unknown"
@@ -129,6 +137,12 @@ class YtdFileInfo:
     drawable_id: int    # 0, 1, 2, ...
     variant: str        # "a", "b", "c", ...
     is_base: bool       # True if variant == "a"
+    file_path: str
+
+    @classmethod
+    def _make(cls, fields: tuple) -> YtdFileInfo:
+        """Build an instance from a tuple in field order."""
+        return cls(*fields)
 
 
 def _derive_gender(file_path: str, model: str) -> str:
@@ -272,14 +286,14 @@ def parse_ytd_filename(file_path: str) -> YtdFileInfo | None:
         if is_prop_category(category) and dlc_name.startswith("p_"):
             dlc_name = dlc_name[2:]
         return YtdFileInfo(
-            file_path=file_path,
-            model=model,
-            dlc_name=dlc_name,
-            gender=_derive_gender(file_path, model),
-            category=category,
-            drawable_id=int(match.group("drawable")),
-            variant=variant,
-            is_base=(variant == "a"),
+            model,
+            dlc_name,
+            _derive_gender(file_path, model),
+            category,
+            int(match.group("drawable")),
+            variant,
+            variant == "a",
+            file_path,
         )
 
     # Try custom ped pattern
@@ -289,14 +303,14 @@ def parse_ytd_filename(file_path: str) -> YtdFileInfo | None:
         variant = match.group("variant")
         # For custom peds, dlc_name is set to the model name
         return YtdFileInfo(
-            file_path=file_path,
-            model=model,
-            dlc_name=model,
-            gender=_derive_gender(file_path, model),
-            category=match.group("category"),
-            drawable_id=int(match.group("drawable")),
-            variant=variant,
-            is_base=(variant == "a"),
+            model,
+            model,
+            _derive_gender(file_path, model),
+            match.group("category"),
+            int(match.group("drawable")),
+            variant,
+            variant == "a",
+            file_path,
         )
 
     # Try base game pattern (no DLC prefix, no ^)
@@ -305,14 +319,14 @@ def parse_ytd_filename(file_path: str) -> YtdFileInfo | None:
         variant = match.group("variant")
         dlc_name, gender = _derive_base_game_info(file_path)
         return YtdFileInfo(
-            file_path=file_path,
-            model="base_game",
-            dlc_name=dlc_name,
-            gender=gender,
-            category=match.group("category"),
-            drawable_id=int(match.group("drawable")),
-            variant=variant,
-            is_base=(variant == "a"),
+            "base_game",
+            dlc_name,
+            gender,
+            match.group("category"),
+            int(match.group("drawable")),
+            variant,
+            variant == "a",
+            file_path,
         )
 
     return None
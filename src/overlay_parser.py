@@ -13,7 +13,9 @@ Companion normal (_n) and specular (_s) maps are skipped.
 from __future__ import annotations
 
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -29,12 +31,26 @@ _FAOV_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Companion normal/specular map filename endings (lower-cased)
+_COMPANION_SUFFIXES = ("_n.ytd", "_s.ytd")
+
 # Types that end with 'f' are female-specific
 _FEMALE_TYPES = frozenset({"eyebrowf", "lips_g", "makeup"})
 
 # Types that end with 'm' are male-specific
 _MALE_TYPES = frozenset({"eyebrowm", "lipsm", "makeupm", "beard"})
 
+# Overlay type -> head mesh gender; unlisted types default to male
+_GENDER_MAP: dict[str, str] = {
+    **dict.fromkeys(_MALE_TYPES, "male"),
+    **dict.fromkeys(_FEMALE_TYPES, "female"),
+}
+
+# Replacement trees are scanned on a small thread pool once there are
+# more packs than this (directory walks are I/O bound, not CPU bound)
+_PARALLEL_SCAN_MIN_DIRS = 4
+_SCAN_THREADS = 4
+
 # Portrait framing categories
 PORTRAIT_UPPER = frozenset({"eyebrowf", "eyebrowm"})  # Forehead area
 PORTRAIT_LOWER = frozenset({"beard"})                   # Jaw/chin area
@@ -63,9 +79,7 @@ def _classify_gender(overlay_type: str) -> str:
 
     Female types use the female head mesh; everything else uses male.
     """
-    if overlay_type in _FEMALE_TYPES:
-        return "female"
-    return "male"
+    return _GENDER_MAP.get(overlay_type, "male")
 
 
 def discover_overlays(overlays_dir: Path) -> list[OverlayInfo]:
@@ -80,17 +94,19 @@ def discover_overlays(overlays_dir: Path) -> list[OverlayInfo]:
 
     results: list[OverlayInfo] = []
 
-    for f in sorted(overlays_dir.iterdir()):
-        if not f.is_file():
-            continue
+    with os.scandir(overlays_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    for entry in entries:
+        name = entry.name
 
-        # Skip normal and specular maps
-        stem = f.stem.lower()
-        if stem.endswith('_n') or stem.endswith('_s'):
+        # Skip normal and specular maps straight from the entry name,
+        # before any Path is built or the regex runs
+        if name.lower().endswith(_COMPANION_SUFFIXES):
             continue
 
-        m = _FAOV_RE.match(f.name)
-        if not m:
+        m = _FAOV_RE.match(name)
+        if not m or not entry.is_file():
             continue
 
         overlay_type = m.group('type').lower()
@@ -98,7 +114,7 @@ def discover_overlays(overlays_dir: Path) -> list[OverlayInfo]:
         gender = _classify_gender(overlay_type)
 
         results.append(OverlayInfo(
-            file_path=f,
+            file_path=overlays_dir / name,
             overlay_type=overlay_type,
             index=index,
             gender=gender,
@@ -118,10 +134,9 @@ def _scan_dir_for_faov(directory: Path) -> list[OverlayInfo]:
         return results
 
     for f in sorted(directory.rglob("mp_fm_faov_*.ytd")):
-        if not f.is_file():
+        if f.name.lower().endswith(_COMPANION_SUFFIXES):
             continue
-        stem = f.stem.lower()
-        if stem.endswith('_n') or stem.endswith('_s'):
+        if not f.is_file():
             continue
         m = _FAOV_RE.match(f.name)
         if not m:
@@ -142,15 +157,26 @@ def discover_replacement_overlays(input_dir: Path) -> list[OverlayInfo]:
     """Scan stream [replacements] directories for face overlay .ytd files.
 
     These are custom replacements that override base game overlays.
-    Walks all ``{input_dir}/*/stream/[replacements]/`` trees.
+    Walks all ``{input_dir}/*/stream/[replacements]/`` trees.  With more
+    than a handful of packs the trees are walked concurrently on a thread
+    pool; results keep the same pack order as a sequential scan.
     """
     results: list[OverlayInfo] = []
     if not input_dir.is_dir():
         return results
 
-    for pack_dir in sorted(input_dir.iterdir()):
-        rep_dir = pack_dir / "stream" / "[replacements]"
-        found = _scan_dir_for_faov(rep_dir)
+    rep_dirs = [
+        pack_dir / "stream" / "[replacements]"
+        for pack_dir in sorted(input_dir.iterdir())
+    ]
+
+    if len(rep_dirs) > _PARALLEL_SCAN_MIN_DIRS:
+        with ThreadPoolExecutor(max_workers=_SCAN_THREADS) as ex:
+            found_per_dir = list(ex.map(_scan_dir_for_faov, rep_dirs))
+    else:
+        found_per_dir = [_scan_dir_for_faov(d) for d in rep_dirs]
+
+    for rep_dir, found in zip(rep_dirs, found_per_dir):
         if found:
             logger.info(
                 "Found %d replacement overlay(s) in %s",
@@ -8,6 +8,10 @@ fallbacks are thin horizontal strips (e.g. 450x84).
 
 from __future__ import annotations
 
+import functools
+import os
+from typing import IO
+
 from PIL import Image
 
 # A good 3D render's visible-content bounding box should have an aspect
@@ -27,31 +31,25 @@ MIN_HEIGHT_FRACTION = 0.25
 BODY_MESH_CATEGORIES = frozenset({"uppr", "lowr", "feet", "head"})
 
 
-def is_flat_texture_fallback(image_path: str, category: str = "") -> bool:
-    """Return True if the image looks like a flat texture strip, not a 3D render.
+def _is_exempt_category(category: str) -> bool:
+    """Return True for categories whose 3D renders are never rejected."""
+    # Props are standalone accessories — their 3D renders are always
+    # preferable to flat textures, even if the bounding box is thin
+    # (e.g. glasses are legitimately wide and short).
+    return category in BODY_MESH_CATEGORIES or category.startswith("p_")
 
-    Checks the bounding box of non-transparent pixels.  Flat diffuse
-    textures produce thin horizontal strips when centered on a square
-    canvas, while proper 3D renders fill a reasonable area.
 
-    Body mesh categories (uppr, lowr, feet, head) always return False
-    because their raw UV texture fallback is a meaningless skin map
-    that is always worse than any 3D render.
+def _is_flat_image(img: Image.Image, category: str = "") -> bool:
+    """In-memory core of :func:`is_flat_texture_fallback`.
 
-    Prop categories (p_head, p_eyes, etc.) always return False because
-    they are standalone 3D objects (hats, glasses, watches) whose
-    renders are inherently small/thin and should never be rejected.
+    Works on an already-open image so callers holding a PIL image (e.g.
+    tests) can skip the encode/decode round-trip through disk.
     """
-    if category in BODY_MESH_CATEGORIES:
-        return False
-
-    # Props are standalone accessories — their 3D renders are always
-    # preferable to flat textures, even if the bounding box is thin
-    # (e.g. glasses are legitimately wide and short).
-    if category.startswith("p_"):
+    if _is_exempt_category(category):
         return False
 
-    img = Image.open(image_path).convert("RGBA")
+    if "A" not in img.getbands():
+        img = img.convert("RGBA")
     canvas_size = img.height  # should be 512
 
     bbox = img.getchannel("A").getbbox()
@@ -78,3 +76,46 @@ def is_flat_texture_fallback(image_path: str, category: str = "") -> bool:
         return True
 
     return False
+
+
+def is_flat_texture_fallback(
+    image_path: str | os.PathLike | IO[bytes] | Image.Image,
+    category: str = "",
+) -> bool:
+    """Return True if the image looks like a flat texture strip, not a 3D render.
+
+    Checks the bounding box of non-transparent pixels.  Flat diffuse
+    textures produce thin horizontal strips when centered on a square
+    canvas, while proper 3D renders fill a reasonable area.
+
+    Body mesh categories (uppr, lowr, feet, head) always return False
+    because their raw UV texture fallback is a meaningless skin map
+    that is always worse than any 3D render.
+
+    Prop categories (p_head, p_eyes, etc.) always return False because
+    they are standalone 3D objects (hats, glasses, watches) whose
+    renders are inherently small/thin and should never be rejected.
+
+    *image_path* may also be an open binary file object (e.g. ``BytesIO``)
+    or an already-loaded PIL image; only real paths are memoized.
+    """
+    # Exempt categories never need the image decoded
+    if _is_exempt_category(category):
+        return False
+
+    if isinstance(image_path, Image.Image):
+        return _is_flat_image(image_path)
+    if not isinstance(image_path, (str, os.PathLike)):
+        with Image.open(image_path) as img:
+            return _is_flat_image(img)
+
+    # Key on size + mtime so a re-rendered file is decoded again
+    st = os.stat(image_path)
+    return _is_flat_file(os.fspath(image_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=64)
+def _is_flat_file(image_path: str, mtime_ns: int, size: int) -> bool:
+    """Decode *image_path* and run the geometry check, memoized per file version."""
+    with Image.open(image_path) as img:
+        return _is_flat_image(img)
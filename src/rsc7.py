@@ -107,7 +107,8 @@ def parse_rsc7(file_path: str | Path) -> RSC7Resource:
     )
 
     # --- Decompress payload (raw deflate, no zlib/gzip wrapper) ---
-    compressed_data = raw[RSC7_HEADER_SIZE:]
+    # memoryview slice: hands zlib the payload without copying it
+    compressed_data = memoryview(raw)[RSC7_HEADER_SIZE:]
     decompressed = zlib.decompress(compressed_data, -15)
 
     # --- Validate segment sizes against decompressed length ---
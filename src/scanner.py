@@ -20,7 +20,7 @@ import json
 
 from src import rsc7, ytd_parser, dds_builder, image_processor
 from src.catalog import CatalogBuilder, CatalogItem
-from src.filename_parser import parse_ytd_filename, parse_tattoo_filename, count_variants, is_prop_category, prop_display_name, category_display_name
+from src.filename_parser import parse_ytd_filename, parse_tattoo_filename, count_variants, category_display_name, PROP_CATEGORIES, PROP_DISPLAY_NAMES
 from src.meta_parser import build_dlc_map
 from src.tattoo_parser import build_tattoo_meta
 from src.ydd_pairer import find_ydd_for_ytd, find_fallback_ydd, find_base_body_ydd
@@ -380,6 +380,11 @@ def scan_and_process(
     # Pre-compute normalized base_game prefix for fast is_base_game checks
     _bg_prefix = os.path.normcase(base_game_dir) if base_game_dir else None
 
+    # Bind prop lookups to locals (same semantics as is_prop_category /
+    # prop_display_name) to skip a global lookup + call per file
+    _is_prop = PROP_CATEGORIES.__contains__
+    _prop_disp = PROP_DISPLAY_NAMES.get
+
     for ytd_path in all_ytd_files:
         info = parse_ytd_filename(ytd_path)
         if info is None:
@@ -412,7 +417,7 @@ def scan_and_process(
         )
 
         # Use display names for props in output paths / catalog keys
-        display_cat = prop_display_name(info.category)
+        display_cat = _prop_disp(info.category, info.category)
 
         if is_mp_head:
             # Temporary path/key for dedup — will be renumbered below
@@ -445,7 +450,7 @@ def scan_and_process(
             "drawable_id": info.drawable_id,
             "source_file": os.path.basename(ytd_path),
             "is_head": is_mp_head,
-            "is_prop": is_prop_category(info.category),
+            "is_prop": _is_prop(info.category),
             "is_base_game": (_bg_prefix is not None and
                 os.path.normcase(ytd_path).startswith(_bg_prefix)),
         })
@@ -40,10 +40,12 @@ _OPACITY_THRESHOLD = 0.95
 
 
 def _texture_hash(ytd_path: str) -> str | None:
-    """Parse a .ytd and return the MD5 hex of its raw diffuse texture data.
+    """Parse a .ytd and return a hex digest of its raw diffuse texture data.
 
     This is fast — only decompresses the RSC7 container and hashes the
-    raw bytes, no image decoding needed.
+    raw bytes, no image decoding needed.  Uses 128-bit BLAKE2b (same
+    32-char hex length as MD5, but faster on 64-bit CPUs); the digest is
+    only compared within a run, never persisted.
     """
     try:
         resource = rsc7.parse_rsc7(ytd_path)
@@ -53,12 +55,25 @@ def _texture_hash(ytd_path: str) -> str | None:
         tex = ytd_parser.select_diffuse_texture(textures)
         if tex is None or not tex.raw_data:
             return None
-        return hashlib.md5(tex.raw_data).hexdigest()
+        return hashlib.blake2b(tex.raw_data, digest_size=16).hexdigest()
     except Exception as exc:
         logger.debug("skin_filter: hash failed for %s: %s", ytd_path, exc)
         return None
 
 
+def _diffuse_opacity(tex: ytd_parser.TextureInfo) -> float:
+    """Decode *tex* and return the fraction of opaque pixels (alpha > 200)."""
+    dds_bytes = dds_builder.build_dds(tex)
+    img = Image.open(BytesIO(dds_bytes)).convert("RGBA")
+    total_pixels = img.width * img.height
+    if total_pixels == 0:
+        return 0.0
+
+    alpha = img.getchannel("A")
+    opaque_count = sum(1 for p in alpha.tobytes() if p > 200)
+    return opaque_count / total_pixels
+
+
 def _texture_opacity(ytd_path: str) -> float:
     """Parse a .ytd and return the fraction of opaque pixels (alpha > 200).
 
@@ -72,31 +87,51 @@ def _texture_opacity(ytd_path: str) -> float:
         tex = ytd_parser.select_diffuse_texture(textures)
         if tex is None or not tex.raw_data:
             return 0.0
+        return _diffuse_opacity(tex)
+    except Exception:
+        return 0.0
 
-        dds_bytes = dds_builder.build_dds(tex)
-        img = Image.open(BytesIO(dds_bytes)).convert("RGBA")
-        total_pixels = img.width * img.height
-        if total_pixels == 0:
-            return 0.0
 
-        alpha = img.getchannel("A")
-        opaque_count = sum(1 for p in alpha.tobytes() if p > 200)
-        return opaque_count / total_pixels
+def _texture_hash_and_opacity_from_parts(
+    virtual_data: bytes,
+    physical_data: bytes,
+) -> tuple[str, float] | None:
+    """Return (hash_hex, opacity_fraction) from decompressed RSC7 segments.
+
+    Same result as :func:`_texture_hash_and_opacity` without the file read
+    and inflate — lets tests feed segments they built in memory.
+    """
+    try:
+        textures = ytd_parser.parse_texture_dictionary(virtual_data, physical_data)
+        tex = ytd_parser.select_diffuse_texture(textures)
+    except Exception as exc:
+        logger.debug("skin_filter: texture parse failed: %s", exc)
+        return None
+    if tex is None or not tex.raw_data:
+        return None
+
+    digest = hashlib.blake2b(tex.raw_data, digest_size=16).hexdigest()
+    try:
+        opacity = _diffuse_opacity(tex)
     except Exception:
-        return 0.0
+        opacity = 0.0
+    return (digest, opacity)
 
 
 def _texture_hash_and_opacity(ytd_path: str) -> tuple[str, float] | None:
-    """Parse a .ytd file and return (md5_hex, opacity_fraction).
+    """Parse a .ytd file and return (hash_hex, opacity_fraction).
 
     Returns None if the file cannot be parsed or has no diffuse texture.
     Used by tests and as a convenience wrapper.
     """
-    md5 = _texture_hash(ytd_path)
-    if md5 is None:
+    try:
+        resource = rsc7.parse_rsc7(ytd_path)
+    except Exception as exc:
+        logger.debug("skin_filter: hash failed for %s: %s", ytd_path, exc)
         return None
-    opacity = _texture_opacity(ytd_path)
-    return (md5, opacity)
+    return _texture_hash_and_opacity_from_parts(
+        resource.virtual_data, resource.physical_data
+    )
 
 
 def filter_body_skin_items(
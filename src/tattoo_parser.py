@@ -61,44 +61,46 @@ class TattooMeta:
     genders: list[str] = field(default_factory=list)  # ["male", "female"]
 
 
-def _lenient_parse_xml(path: Path) -> ET.Element:
-    """Parse XML with lenient error handling for common GTA V meta issues.
+def _parse_cleaned_xml(path: Path) -> ET.Element:
+    """Parse XML after cleaning up common GTA V meta issues.
 
-    Some .meta files have stray closing tags or other minor XML errors.
-    This attempts a strict parse first, then falls back to cleaning the
-    XML text and retrying.
+    Some .meta files have stray closing tags or other minor XML errors;
+    callers use this once a strict parse has already failed.
     """
-    try:
-        return ET.parse(path).getroot()
-    except ET.ParseError:
-        # Fallback: read as text, remove duplicate/stray closing tags, retry
-        text = path.read_text(encoding="utf-8")
-        # Remove lines that are just stray </Item> not preceded by item content
-        # Simple heuristic: remove consecutive </Item> on adjacent lines
-        import re as _re
-        text = _re.sub(r"(</Item>\s*\n)\s*</Item>", r"\1", text)
-        return ET.fromstring(text)
+    text = path.read_text(encoding="utf-8")
+    # Remove lines that are just stray </Item> not preceded by item content
+    # Simple heuristic: remove consecutive </Item> on adjacent lines
+    text = re.sub(r"(</Item>\s*\n)\s*</Item>", r"\1", text)
+    return ET.fromstring(text)
 
 
-def parse_shop_tattoo_meta(meta_path: str | Path) -> dict[str, dict]:
-    """Parse a shop_tattoo.meta file.
+def _iter_shop_items(path: Path):
+    """Yield the <Item> elements of a shop_tattoo.meta file.
 
-    Returns a dict keyed by preset base name (e.g. "rushtattoo_000") with
-    values containing zone, facing, and label info.
+    Streams the file with ``iterparse`` and detaches each item from its
+    parent once the caller has consumed it, so the full tree is never held
+    in memory. Files that fail to parse strictly are re-read through
+    :func:`_parse_cleaned_xml` (the caller restarts on ``ParseError``).
     """
-    path = Path(meta_path)
-    root = _lenient_parse_xml(path)
+    stack: list[ET.Element] = []
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if not stack and elem.tag != "TattooShopItemArray":
+                raise ValueError(
+                    f"Expected <TattooShopItemArray> root, got <{elem.tag}> in {path.name}"
+                )
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag == "Item" and stack:
+            yield elem
+            stack[-1].remove(elem)
 
-    if root.tag != "TattooShopItemArray":
-        raise ValueError(
-            f"Expected <TattooShopItemArray> root, got <{root.tag}> in {path.name}"
-        )
 
+def _collect_shop_items(items) -> dict[str, dict]:
+    """Build the parse_shop_tattoo_meta() result from <Item> elements."""
     results: dict[str, dict] = {}
 
-    # Items may be directly under root or nested under <TattooShopItems>
-    items = root.findall(".//Item")
-
     for item in items:
         preset_el = item.find("preset")
         if preset_el is None or not (preset_el.text or "").strip():
@@ -133,6 +135,29 @@ def parse_shop_tattoo_meta(meta_path: str | Path) -> dict[str, dict]:
     return results
 
 
+def parse_shop_tattoo_meta(meta_path: str | Path) -> dict[str, dict]:
+    """Parse a shop_tattoo.meta file.
+
+    Returns a dict keyed by preset base name (e.g. "rushtattoo_000") with
+    values containing zone, facing, and label info.
+    """
+    path = Path(meta_path)
+
+    # Items may be directly under root or nested under <TattooShopItems>
+    try:
+        return _collect_shop_items(_iter_shop_items(path))
+    except ET.ParseError:
+        pass
+
+    # Malformed file: the strict parse already failed, go straight to clean-up
+    root = _parse_cleaned_xml(path)
+    if root.tag != "TattooShopItemArray":
+        raise ValueError(
+            f"Expected <TattooShopItemArray> root, got <{root.tag}> in {path.name}"
+        )
+    return _collect_shop_items(root.iter("Item"))
+
+
 def parse_overlays_xml(xml_path: str | Path) -> dict[str, list[str]]:
     """Parse a *_overlays.xml file for gender information.
 
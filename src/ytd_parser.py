@@ -103,6 +103,18 @@ def _calc_total_data_size(width: int, height: int, mip_levels: int,
     return total
 
 
+def top_mip_size(texture: TextureInfo) -> int | None:
+    """Return the byte size of *texture*'s first mip level.
+
+    Returns None when the format code is not in TEXTURE_FORMATS.
+    """
+    fmt_entry = TEXTURE_FORMATS.get(texture.format_code)
+    if fmt_entry is None:
+        return None
+    format_name, bpp = fmt_entry
+    return _calc_mip_size(texture.width, texture.height, format_name, bpp)
+
+
 # ---------------------------------------------------------------------------
 # Public data classes
 # ---------------------------------------------------------------------------
@@ -0,0 +1,19 @@
+"""Shared pytest fixtures for the test suite."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+
+def _touch_many(tmp: Path, names: list[str]) -> None:
+    """Create empty files *names* under *tmp* (equivalent to Path.touch())."""
+    base = os.fspath(tmp)
+    for name in names:
+        os.close(os.open(os.path.join(base, name), os.O_CREAT | os.O_WRONLY, 0o666))
+
+
+@pytest.fixture
+def touch_many():
+    """Return a helper that creates many empty files in one directory."""
+    return _touch_many
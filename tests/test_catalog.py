@@ -138,10 +138,28 @@ def test_write_empty_catalog():
     assert data["items"] == {}
 
 
+def test_to_dict_matches_written_json():
+    builder = CatalogBuilder()
+    builder.add_item(_make_item())
+    builder.add_failure("bad.ytd", "ValueError: boom")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out_path = os.path.join(tmpdir, "catalog.json")
+        builder.write(out_path)
+
+        with open(out_path, "r", encoding="utf-8") as f:
+            written = json.load(f)
+
+    data = builder.to_dict()
+    assert data["items"] == written["items"]
+    assert data["total_items"] == written["total_items"] == 1
+    assert data["total_failed"] == written["total_failed"] == 1
+
+
 if __name__ == "__main__":
     test_add_item_key_format()
     test_add_item_overwrites_duplicate()
     test_add_failure()
     test_write_creates_directories_and_valid_json()
     test_write_empty_catalog()
+    test_to_dict_matches_written_json()
     print("All catalog tests passed!")
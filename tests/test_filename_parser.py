@@ -61,6 +61,14 @@ class TestStandardPattern:
         assert info is not None
         assert info.drawable_id == 999
 
+    def test_make_matches_parsed_info(self):
+        path = "mp_f_freemode_01_dlc^jbib_diff_004_a_uni.ytd"
+        info = parse_ytd_filename(path)
+        rebuilt = YtdFileInfo._make(
+            ("mp_f_freemode_01", "dlc", "female", "jbib", 4, "a", True, path)
+        )
+        assert rebuilt == info
+
 
 # ---------------------------------------------------------------------------
 # Custom ped pattern
@@ -167,6 +175,12 @@ class TestPropCategory:
         assert is_prop_category("lowr") is False
         assert is_prop_category("head") is False
 
+    def test_short_and_empty_are_not_props(self):
+        assert is_prop_category("") is False
+        assert is_prop_category("p") is False
+        assert is_prop_category("p_") is False
+        assert is_prop_category("p_hat") is False
+
     def test_prop_categories_constant(self):
         assert len(PROP_CATEGORIES) == 5
         assert "p_head" in PROP_CATEGORIES
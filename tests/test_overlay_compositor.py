@@ -86,3 +86,16 @@ class TestTintOverlay:
 
         result = np.array(tinted)
         assert result[:, :, 3].max() == 0
+
+    def test_per_pixel_alpha_copied_verbatim(self):
+        """Varying alpha values should be copied through unchanged per pixel."""
+        arr = np.zeros((3, 5, 4), dtype=np.uint8)
+        arr[:, :, 0:3] = 180
+        arr[:, :, 3] = np.arange(15, dtype=np.uint8).reshape(3, 5) * 17
+        overlay = Image.fromarray(arr, "RGBA")
+
+        tinted = _tint_overlay(overlay, (60, 45, 30))
+
+        result = np.array(tinted)
+        assert result.shape == (3, 5, 4)
+        np.testing.assert_array_equal(result[:, :, 3], arr[:, :, 3])
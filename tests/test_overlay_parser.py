@@ -1,12 +1,12 @@
 """Tests for overlay_parser — face overlay discovery and classification."""
 
-import os
 import tempfile
 from pathlib import Path
 
 from src.overlay_parser import (
     OverlayInfo,
     discover_overlays,
+    discover_replacement_overlays,
     _classify_gender,
     _FAOV_RE,
     PORTRAIT_UPPER,
@@ -194,7 +194,7 @@ class TestDiscoverOverlays:
         results = discover_overlays(Path("/nonexistent/path"))
         assert results == []
 
-    def test_all_overlay_types(self):
+    def test_all_overlay_types(self, touch_many):
         """Verify all known overlay types are recognized."""
         with tempfile.TemporaryDirectory() as tmpdir:
             types = [
@@ -203,9 +203,29 @@ class TestDiscoverOverlays:
                 "infect", "lips", "lips_g", "lipsm", "makeup", "makeupm",
                 "mole", "skin", "spots", "weather",
             ]
-            for t in types:
-                Path(tmpdir, f"mp_fm_faov_{t}_000.ytd").touch()
+            touch_many(Path(tmpdir), [f"mp_fm_faov_{t}_000.ytd" for t in types])
 
             results = discover_overlays(Path(tmpdir))
             found_types = {r.overlay_type for r in results}
             assert found_types == set(types)
+
+
+class TestDiscoverReplacementOverlays:
+    def test_many_packs_keep_pack_order(self, tmp_path, touch_many):
+        """Packs scanned concurrently still come back in sorted pack order."""
+        packs = [f"pack{i}" for i in range(6)]
+        for i, pack in enumerate(packs):
+            rep_dir = tmp_path / pack / "stream" / "[replacements]" / "faces"
+            rep_dir.mkdir(parents=True)
+            touch_many(rep_dir, [
+                f"mp_fm_faov_beard_{i:03d}.ytd",
+                f"mp_fm_faov_beard_{i:03d}_n.ytd",
+            ])
+
+        results = discover_replacement_overlays(tmp_path)
+
+        assert [r.index for r in results] == list(range(6))
+        assert [r.file_path.parts[-5] for r in results] == packs
+
+    def test_missing_input_dir(self, tmp_path):
+        assert discover_replacement_overlays(tmp_path / "missing") == []
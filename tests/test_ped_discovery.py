@@ -1,6 +1,5 @@
 """Tests for custom ped discovery."""
 
-import os
 import pytest
 from src.scanner import discover_custom_peds
 
@@ -8,15 +7,15 @@ from src.scanner import discover_custom_peds
 class TestDiscoverCustomPeds:
     """Test discovery of custom ped directories with .yft skeletons."""
 
-    def test_finds_ped_with_yft(self, tmp_path):
+    def test_finds_ped_with_yft(self, tmp_path, touch_many):
         """A directory containing a .yft file is detected as a custom ped."""
         ped_dir = tmp_path / "stream" / "rhpeds" / "stream" / "[strafe]"
         ped_dir.mkdir(parents=True)
         (ped_dir / "strafe.yft").write_bytes(b"\x00" * 100)
         # Create default body part YDDs + YTDs
-        for cat in ("head", "uppr", "lowr", "feet", "hand"):
-            (ped_dir / f"strafe^{cat}_000_u.ydd").write_bytes(b"\x00" * 2000)
-            (ped_dir / f"strafe^{cat}_diff_000_a_uni.ytd").write_bytes(b"\x00" * 200)
+        cats = ("head", "uppr", "lowr", "feet", "hand")
+        touch_many(ped_dir, [f"strafe^{cat}_000_u.ydd" for cat in cats]
+                    + [f"strafe^{cat}_diff_000_a_uni.ytd" for cat in cats])
 
         peds = discover_custom_peds(str(tmp_path / "stream"))
         assert len(peds) == 1
@@ -50,26 +49,26 @@ class TestDiscoverCustomPeds:
         assert head["ydd_path"].endswith("testped^head_000_u.ydd")
         assert head["ytd_path"].endswith("testped^head_diff_000_a_uni.ytd")
 
-    def test_includes_optional_hair(self, tmp_path):
+    def test_includes_optional_hair(self, tmp_path, touch_many):
         """Hair (optional category) is included when present."""
         ped_dir = tmp_path / "stream" / "pack" / "stream" / "[myped]"
         ped_dir.mkdir(parents=True)
         (ped_dir / "myped.yft").write_bytes(b"\x00" * 100)
-        for cat in ("head", "uppr", "lowr", "feet", "hand", "hair"):
-            (ped_dir / f"myped^{cat}_000_u.ydd").write_bytes(b"\x00" * 2000)
-            (ped_dir / f"myped^{cat}_diff_000_a_uni.ytd").write_bytes(b"\x00" * 200)
+        cats = ("head", "uppr", "lowr", "feet", "hand", "hair")
+        touch_many(ped_dir, [f"myped^{cat}_000_u.ydd" for cat in cats]
+                    + [f"myped^{cat}_diff_000_a_uni.ytd" for cat in cats])
 
         peds = discover_custom_peds(str(tmp_path / "stream"))
         assert "hair" in peds[0]["body_parts"]
 
-    def test_output_path(self, tmp_path):
+    def test_output_path(self, tmp_path, touch_many):
         """Output path follows textures/{ped_name}/preview.webp convention."""
         ped_dir = tmp_path / "stream" / "pack" / "stream" / "[strafe]"
         ped_dir.mkdir(parents=True)
         (ped_dir / "strafe.yft").write_bytes(b"\x00" * 100)
-        for cat in ("head", "uppr", "lowr", "feet", "hand"):
-            (ped_dir / f"strafe^{cat}_000_u.ydd").write_bytes(b"\x00" * 2000)
-            (ped_dir / f"strafe^{cat}_diff_000_a_uni.ytd").write_bytes(b"\x00" * 200)
+        cats = ("head", "uppr", "lowr", "feet", "hand")
+        touch_many(ped_dir, [f"strafe^{cat}_000_u.ydd" for cat in cats]
+                    + [f"strafe^{cat}_diff_000_a_uni.ytd" for cat in cats])
 
         peds = discover_custom_peds(str(tmp_path / "stream"))
         assert peds[0]["output_rel"] == "strafe/preview.webp"
@@ -5,10 +5,17 @@ proper 3D renders from flat texture strips that slipped through.
 Uses actual output files from Mp_f_2023_02/jbib as test cases.
 """
 
+import io
 import os
+
+import numpy as np
 import pytest
 from PIL import Image
-from src.render_quality import is_flat_texture_fallback, BODY_MESH_CATEGORIES
+from src.render_quality import (
+    BODY_MESH_CATEGORIES,
+    _is_flat_image,
+    is_flat_texture_fallback,
+)
 
 OUTPUT_DIR = os.path.join(
     os.path.dirname(__file__), "..", "output", "textures", "Mp_f_2023_02", "jbib"
@@ -19,63 +26,83 @@ def _have_output_files():
     return os.path.isdir(OUTPUT_DIR)
 
 
+def _make_rect_rgba(canvas=512, content_w=450, content_h=84):
+    """Return a transparent canvas x canvas RGBA array with a centered opaque rect."""
+    arr = np.zeros((canvas, canvas, 4), dtype=np.uint8)
+    x = (canvas - content_w) // 2
+    y = (canvas - content_h) // 2
+    arr[y:y + content_h, x:x + content_w] = (128, 128, 128, 255)
+    return arr
+
+
+def _make_rect_image(content_w=450, content_h=84, canvas=512):
+    """In-memory RGBA image with a centered opaque rect (no disk I/O)."""
+    return Image.fromarray(_make_rect_rgba(canvas, content_w, content_h), "RGBA")
+
+
+@pytest.fixture(scope="session")
+def rect_webp(tmp_path_factory):
+    """Return a getter for on-disk WEBP rect images, encoded once per shape.
+
+    ``rect_webp(content_w, content_h, canvas=512)`` returns the path to a
+    transparent canvas with a centered opaque rect; the same shape is
+    reused across every test (and parametrized category) that asks for it.
+    """
+    cache: dict[tuple[int, int, int], str] = {}
+    rect_dir = tmp_path_factory.mktemp("rects")
+
+    def _get(content_w, content_h, canvas=512):
+        key = (canvas, content_w, content_h)
+        if key not in cache:
+            arr = _make_rect_rgba(canvas, content_w, content_h)
+            path = rect_dir / f"{canvas}_{content_w}_{content_h}.webp"
+            # Fastest libwebp settings: lossless keeps the alpha geometry
+            # exact, quality/method 0 skip the compression analysis passes
+            Image.fromarray(arr, "RGBA").save(
+                path, "WEBP", lossless=True, quality=0, method=0,
+            )
+            cache[key] = str(path)
+        return cache[key]
+
+    return _get
+
+
 # ---------------------------------------------------------------------------
 # Unit tests using synthetic images
 # ---------------------------------------------------------------------------
 
 class TestFlatTextureDetection:
-    """Test the detection heuristic with synthetic images."""
-
-    def _make_image(self, canvas=512, content_w=450, content_h=84):
-        """Create a synthetic image with opaque content of given size, centered."""
-        img = Image.new("RGBA", (canvas, canvas), (0, 0, 0, 0))
-        x = (canvas - content_w) // 2
-        y = (canvas - content_h) // 2
-        for px in range(x, x + content_w):
-            for py in range(y, y + content_h):
-                img.putpixel((px, py), (128, 128, 128, 255))
-        return img
-
-    def _save_tmp(self, img, tmp_path, name="test.webp"):
-        path = os.path.join(str(tmp_path), name)
-        img.save(path, "WEBP")
-        return path
-
-    def test_thin_horizontal_strip_is_flat(self, tmp_path):
+    """Test the detection heuristic with synthetic in-memory images."""
+
+    def test_thin_horizontal_strip_is_flat(self):
         """A 450x84 strip (ratio 5.36) should be detected as flat."""
-        img = self._make_image(content_w=450, content_h=84)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path) is True
+        img = _make_rect_image(450, 84)
+        assert _is_flat_image(img) is True
 
-    def test_proper_clothing_shape_is_not_flat(self, tmp_path):
+    def test_proper_clothing_shape_is_not_flat(self):
         """A 450x313 shape (ratio 1.44) should NOT be detected as flat."""
-        img = self._make_image(content_w=450, content_h=313)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path) is False
+        img = _make_rect_image(450, 313)
+        assert _is_flat_image(img) is False
 
-    def test_tall_narrow_clothing_is_not_flat(self, tmp_path):
+    def test_tall_narrow_clothing_is_not_flat(self):
         """A 240x457 shape (ratio 0.53) — like a dress — is NOT flat."""
-        img = self._make_image(content_w=240, content_h=457)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path) is False
+        img = _make_rect_image(240, 457)
+        assert _is_flat_image(img) is False
 
-    def test_nearly_square_is_not_flat(self, tmp_path):
+    def test_nearly_square_is_not_flat(self):
         """A 450x471 shape (ratio 0.96) is clearly a 3D render."""
-        img = self._make_image(content_w=450, content_h=471)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path) is False
+        img = _make_rect_image(450, 471)
+        assert _is_flat_image(img) is False
 
-    def test_empty_image_is_flat(self, tmp_path):
+    def test_empty_image_is_flat(self):
         """A completely transparent image should be detected as flat."""
-        img = Image.new("RGBA", (512, 512), (0, 0, 0, 0))
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path) is True
+        img = _make_rect_image(0, 0)
+        assert _is_flat_image(img) is True
 
-    def test_very_thin_strip_is_flat(self, tmp_path):
+    def test_very_thin_strip_is_flat(self):
         """An extremely thin strip (450x20) is definitely flat."""
-        img = self._make_image(content_w=450, content_h=20)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path) is True
+        img = _make_rect_image(450, 20)
+        assert _is_flat_image(img) is True
 
 
 # ---------------------------------------------------------------------------
@@ -89,45 +116,27 @@ class TestBodyMeshCategoriesNeverReject:
     better than showing the UV layout to the user.
     """
 
-    def _make_image(self, canvas=512, content_w=450, content_h=84):
-        img = Image.new("RGBA", (canvas, canvas), (0, 0, 0, 0))
-        x = (canvas - content_w) // 2
-        y = (canvas - content_h) // 2
-        for px in range(x, x + content_w):
-            for py in range(y, y + content_h):
-                img.putpixel((px, py), (128, 128, 128, 255))
-        return img
-
-    def _save_tmp(self, img, tmp_path, name="test.webp"):
-        path = os.path.join(str(tmp_path), name)
-        img.save(path, "WEBP")
-        return path
-
     @pytest.mark.parametrize("category", sorted(BODY_MESH_CATEGORIES))
-    def test_thin_strip_accepted_for_body_category(self, category, tmp_path):
+    def test_thin_strip_accepted_for_body_category(self, category):
         """A thin strip (normally rejected) must be kept for body categories."""
-        img = self._make_image(content_w=450, content_h=84)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path, category=category) is False
+        img = _make_rect_image(450, 84)
+        assert _is_flat_image(img, category=category) is False
 
     @pytest.mark.parametrize("category", sorted(BODY_MESH_CATEGORIES))
-    def test_empty_image_accepted_for_body_category(self, category, tmp_path):
+    def test_empty_image_accepted_for_body_category(self, category):
         """Even an edge-case image is kept for body categories."""
-        img = self._make_image(content_w=450, content_h=20)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path, category=category) is False
+        img = _make_rect_image(450, 20)
+        assert _is_flat_image(img, category=category) is False
 
-    def test_non_body_category_still_rejected(self, tmp_path):
+    def test_non_body_category_still_rejected(self):
         """Non-body categories (e.g. jbib) should still be rejected for thin strips."""
-        img = self._make_image(content_w=450, content_h=84)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path, category="jbib") is True
+        img = _make_rect_image(450, 84)
+        assert _is_flat_image(img, category="jbib") is True
 
-    def test_no_category_still_rejected(self, tmp_path):
+    def test_no_category_still_rejected(self):
         """Default (no category) should still be rejected for thin strips."""
-        img = self._make_image(content_w=450, content_h=84)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path) is True
+        img = _make_rect_image(450, 84)
+        assert _is_flat_image(img) is True
 
 
 # ---------------------------------------------------------------------------
@@ -144,45 +153,68 @@ class TestPropCategoriesNeverReject:
 
     _PROP_CATEGORIES = ["p_head", "p_eyes", "p_ears", "p_lwrist", "p_rwrist"]
 
-    def _make_image(self, canvas=512, content_w=450, content_h=84):
-        img = Image.new("RGBA", (canvas, canvas), (0, 0, 0, 0))
-        x = (canvas - content_w) // 2
-        y = (canvas - content_h) // 2
-        for px in range(x, x + content_w):
-            for py in range(y, y + content_h):
-                img.putpixel((px, py), (128, 128, 128, 255))
-        return img
-
-    def _save_tmp(self, img, tmp_path, name="test.webp"):
-        path = os.path.join(str(tmp_path), name)
-        img.save(path, "WEBP")
-        return path
-
     @pytest.mark.parametrize("category", _PROP_CATEGORIES)
-    def test_thin_strip_accepted_for_prop(self, category, tmp_path):
+    def test_thin_strip_accepted_for_prop(self, category):
         """A thin strip (like glasses, ratio 5.36) must be kept for props."""
-        img = self._make_image(content_w=450, content_h=84)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path, category=category) is False
+        img = _make_rect_image(450, 84)
+        assert _is_flat_image(img, category=category) is False
 
     @pytest.mark.parametrize("category", _PROP_CATEGORIES)
-    def test_wide_short_render_accepted_for_prop(self, category, tmp_path):
+    def test_wide_short_render_accepted_for_prop(self, category):
         """A wide, short render (like glasses, ratio ~3.3) must be kept for props."""
-        img = self._make_image(content_w=250, content_h=75)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path, category=category) is False
+        img = _make_rect_image(250, 75)
+        assert _is_flat_image(img, category=category) is False
 
-    def test_glasses_shape_rejected_without_prop_category(self, tmp_path):
+    def test_glasses_shape_rejected_without_prop_category(self):
         """The same glasses-like shape should be rejected without a prop category."""
-        img = self._make_image(content_w=450, content_h=84)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path, category="accs") is True
+        img = _make_rect_image(450, 84)
+        assert _is_flat_image(img, category="accs") is True
 
-    def test_unknown_p_prefix_also_exempt(self, tmp_path):
+    def test_unknown_p_prefix_also_exempt(self):
         """Any p_ prefixed category should be exempt (future-proof)."""
-        img = self._make_image(content_w=450, content_h=84)
-        path = self._save_tmp(img, tmp_path)
-        assert is_flat_texture_fallback(path, category="p_future") is False
+        img = _make_rect_image(450, 84)
+        assert _is_flat_image(img, category="p_future") is False
+
+
+# ---------------------------------------------------------------------------
+# File-path API
+# ---------------------------------------------------------------------------
+
+class TestFilePathWrapper:
+    """is_flat_texture_fallback() opens the file and delegates to _is_flat_image()."""
+
+    def test_thin_strip_file_is_flat(self, rect_webp):
+        assert is_flat_texture_fallback(rect_webp(450, 84)) is True
+
+    def test_clothing_shape_file_is_not_flat(self, rect_webp):
+        assert is_flat_texture_fallback(rect_webp(450, 313)) is False
+
+    def test_file_object_is_accepted(self):
+        """In-memory streams skip the filesystem round-trip entirely."""
+        buf = io.BytesIO()
+        _make_rect_image(450, 84).save(buf, "PNG", compress_level=0)
+        buf.seek(0)
+        assert is_flat_texture_fallback(buf) is True
+
+    def test_pil_image_is_accepted(self):
+        assert is_flat_texture_fallback(_make_rect_image(450, 313)) is False
+
+    def test_exempt_category_skips_decode(self, tmp_path):
+        """Exempt categories return False without opening the file."""
+        missing = str(tmp_path / "missing.webp")
+        assert is_flat_texture_fallback(missing, category="uppr") is False
+        assert is_flat_texture_fallback(missing, category="p_eyes") is False
+
+    def test_rewritten_file_is_rechecked(self, tmp_path):
+        """A re-render at the same path must not reuse the cached verdict."""
+        path = tmp_path / "render.png"
+        _make_rect_image(450, 84).save(path, "PNG")
+        assert is_flat_texture_fallback(str(path)) is True
+
+        _make_rect_image(450, 313).save(path, "PNG")
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert is_flat_texture_fallback(str(path)) is False
 
 
 # ---------------------------------------------------------------------------
@@ -235,14 +267,18 @@ class TestFlatOverlayFallback:
         assert os.path.isfile(output_webp)
 
         # The render should look like a 3D body, not a flat UV map
-        img = Image.open(output_webp).convert("RGBA")
-        bbox = img.getchannel("A").getbbox()
+        # WEBP renders are stored as RGBA, so read the alpha band directly
+        # instead of converting (and copying) the whole image first
+        with Image.open(output_webp) as img:
+            assert "A" in img.getbands(), "Render has no alpha channel"
+            bbox = img.getchannel("A").getbbox()
+            canvas_w, canvas_h = img.width, img.height
         assert bbox is not None, "Render is completely empty"
 
         x0, y0, x1, y1 = bbox
         w, h = x1 - x0, y1 - y0
         aspect = w / h
-        coverage = (w * h) / (img.width * img.height) * 100
+        coverage = (w * h) / (canvas_w * canvas_h) * 100
 
         # UV map: ~1:1 aspect, ~76% coverage (fills square)
         # 3D body: ~1.57 aspect, ~49% coverage (body shape on transparent bg)
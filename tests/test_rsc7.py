@@ -1,5 +1,6 @@
 """Tests for RSC7 container parser — header validation, decompression, errors."""
 
+import functools
 import struct
 import tempfile
 import zlib
@@ -9,6 +10,19 @@ import pytest
 from src.rsc7 import parse_rsc7, get_size_from_flags, RSC7_MAGIC, RSC7_HEADER_SIZE
 
 
+@functools.lru_cache(maxsize=128)
+def _encode_flags(size: int) -> int:
+    """Compute RSC7 flags that encode a segment size.
+
+    For simplicity, use ss=0 (base=512) and s4 to encode page count.
+    """
+    if size == 0:
+        return 0
+    base = 0x200  # ss=0
+    pages = (size + base * 16 - 1) // (base * 16)
+    return (pages & 0x7F) << 17  # s4 field
+
+
 class TestGetSizeFromFlags:
     def test_zero_flags(self):
         assert get_size_from_flags(0) == 0
@@ -27,20 +41,13 @@ class TestParseRSC7:
         """Build a minimal valid RSC7 file for testing."""
         combined = virtual_data + physical_data
 
-        # Compute flags that encode the segment sizes.
-        # For simplicity, use ss=0 (base=512) and s4 to encode page count.
-        def encode_flags(size: int) -> int:
-            if size == 0:
-                return 0
-            base = 0x200  # ss=0
-            pages = (size + base * 16 - 1) // (base * 16)
-            return (pages & 0x7F) << 17  # s4 field
-
-        sys_flags = encode_flags(len(virtual_data))
-        gfx_flags = encode_flags(len(physical_data))
+        sys_flags = _encode_flags(len(virtual_data))
+        gfx_flags = _encode_flags(len(physical_data))
 
         header = struct.pack("<4I", RSC7_MAGIC, version, sys_flags, gfx_flags)
-        compressed = zlib.compress(combined)[2:-4]  # raw deflate (strip zlib wrapper)
+        # Raw deflate (wbits=-15): no zlib header or Adler-32 trailer
+        co = zlib.compressobj(6, zlib.DEFLATED, -15)
+        compressed = co.compress(combined) + co.flush()
         return header + compressed
 
     def test_valid_file(self, tmp_path):
@@ -78,20 +85,21 @@ class TestRealTattooFile:
 
     TATTOO_PATH = "stream/new_overlays/stream/rushtattoo_000.ytd"
 
-    @pytest.fixture(autouse=True)
-    def _skip_if_missing(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def resource(cls):
+        """Parse the tattoo once and share it across the class's tests."""
         import os
-        if not os.path.isfile(self.TATTOO_PATH):
+        if not os.path.isfile(cls.TATTOO_PATH):
             pytest.skip("Tattoo test fixture not available")
+        return parse_rsc7(cls.TATTOO_PATH)
 
-    def test_parses_successfully(self):
-        resource = parse_rsc7(self.TATTOO_PATH)
+    def test_parses_successfully(self, resource):
         assert resource.version == 13
         assert len(resource.virtual_data) >= 64
         assert len(resource.physical_data) > 0
 
-    def test_segments_have_data(self):
-        resource = parse_rsc7(self.TATTOO_PATH)
+    def test_segments_have_data(self, resource):
         # Physical data should contain actual pixel data (not all zeros)
         non_zero = sum(1 for b in resource.physical_data[:4096] if b != 0)
         assert non_zero > 100, "Physical data appears to be mostly zeros"
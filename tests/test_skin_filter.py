@@ -5,11 +5,10 @@ body skin textures (duplicated opaque textures in uppr/lowr categories)
 while preserving unique clothing textures.
 """
 
+import functools
 import hashlib
 import os
-import struct
 import tempfile
-import zlib
 
 import pytest
 from PIL import Image
@@ -19,181 +18,55 @@ from src.skin_filter import (
     _DUPLICATE_THRESHOLD,
     _OPACITY_THRESHOLD,
     _texture_hash_and_opacity,
+    _texture_hash_and_opacity_from_parts,
     filter_body_skin_items,
 )
+from tests.ytd_builders import (
+    build_ytd_bytes,
+    build_ytd_segments,
+    make_dxt1_data,
+)
 
 
 # ---------------------------------------------------------------------------
 # Helpers: create minimal .ytd files with controlled textures
 # ---------------------------------------------------------------------------
 
-def _make_dxt1_data(width: int, height: int, rgb: tuple[int, int, int]) -> bytes:
-    """Create minimal DXT1-compressed data that decodes to a solid color.
-
-    DXT1 uses 4x4 pixel blocks, each 8 bytes:
-      - 2 bytes: color0 (RGB565)
-      - 2 bytes: color1 (RGB565)
-      - 4 bytes: index bits (all 0 → every pixel uses color0)
-    """
-    r, g, b = rgb
-    # Pack as RGB565 (5 bits R, 6 bits G, 5 bits B)
-    color565 = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
-    color_bytes = struct.pack("<H", color565)
-
-    block = color_bytes + color_bytes + b"\x00\x00\x00\x00"  # 8 bytes per block
-
-    blocks_x = max(1, (width + 3) // 4)
-    blocks_y = max(1, (height + 3) // 4)
-    return block * (blocks_x * blocks_y)
-
-
-def _build_ytd_bytes(
+@functools.lru_cache(maxsize=64)
+def _solid_ytd_bytes(
     tex_name: str,
     width: int,
     height: int,
-    raw_data: bytes,
-    format_code: int = 0x31545844,  # DXT1
+    rgb: tuple[int, int, int],
 ) -> bytes:
-    """Build a minimal RSC7 .ytd resource with one texture.
-
-    This creates a valid RSC7 file that rsc7.parse_rsc7() can decompress
-    and ytd_parser.parse_texture_dictionary() can parse.
-    """
-    # --- Virtual segment (structs) ---
-    # TextureDictionary header: 64 bytes
-    # Texture pointer array: 8 bytes (one pointer)
-    # Texture struct: 144 bytes
-    # Texture name: variable
-
-    name_bytes = tex_name.encode("ascii") + b"\x00"
-    # Pad name to 4-byte alignment
-    while len(name_bytes) % 4 != 0:
-        name_bytes += b"\x00"
-
-    # Layout offsets within virtual segment:
-    DICT_OFFSET = 0           # TextureDictionary header (64 bytes)
-    PTR_ARRAY_OFFSET = 64     # Pointer array (8 bytes)
-    TEX_OFFSET = 72           # Texture struct (144 bytes)
-    NAME_OFFSET = 216         # Name string
-
-    virtual_size = NAME_OFFSET + len(name_bytes)
-    virtual = bytearray(virtual_size)
-
-    # TextureDictionary header
-    # 0x30: pointer to texture pointer array
-    textures_ptr = 0x50000000 + PTR_ARRAY_OFFSET
-    struct.pack_into("<Q", virtual, 0x30, textures_ptr)
-    # 0x38: count, 0x3A: capacity
-    struct.pack_into("<H", virtual, 0x38, 1)   # count = 1
-    struct.pack_into("<H", virtual, 0x3A, 1)   # capacity = 1
-
-    # Pointer array: one 64-bit pointer to the texture struct
-    tex_ptr = 0x50000000 + TEX_OFFSET
-    struct.pack_into("<Q", virtual, PTR_ARRAY_OFFSET, tex_ptr)
-
-    # Texture struct (144 bytes at TEX_OFFSET)
-    # 0x28: name pointer
-    name_ptr = 0x50000000 + NAME_OFFSET
-    struct.pack_into("<Q", virtual, TEX_OFFSET + 0x28, name_ptr)
-    # 0x50: width, 0x52: height
-    struct.pack_into("<H", virtual, TEX_OFFSET + 0x50, width)
-    struct.pack_into("<H", virtual, TEX_OFFSET + 0x52, height)
-    # 0x56: stride
-    struct.pack_into("<H", virtual, TEX_OFFSET + 0x56, width)
-    # 0x58: format code
-    struct.pack_into("<I", virtual, TEX_OFFSET + 0x58, format_code)
-    # 0x5D: mip levels
-    virtual[TEX_OFFSET + 0x5D] = 1
-    # 0x70: data pointer (into physical segment at offset 0)
-    data_ptr = 0x60000000
-    struct.pack_into("<Q", virtual, TEX_OFFSET + 0x70, data_ptr)
-
-    # Name string
-    virtual[NAME_OFFSET:NAME_OFFSET + len(name_bytes)] = name_bytes
-
-    # --- Physical segment (pixel data) ---
-    physical = bytes(raw_data)
-
-    # --- RSC7 container ---
-    virtual_flags = _encode_rsc7_flags(len(virtual))
-    physical_flags = _encode_rsc7_flags(len(physical))
-
-    # Pad segments to match the sizes that get_size_from_flags() returns.
-    # The parser uses flag-derived sizes to split the decompressed data.
-    from src.rsc7 import get_size_from_flags
-    virt_padded_size = get_size_from_flags(virtual_flags)
-    phys_padded_size = get_size_from_flags(physical_flags)
-
-    padded_virtual = bytes(virtual) + b"\x00" * (virt_padded_size - len(virtual))
-    padded_physical = physical + b"\x00" * (phys_padded_size - len(physical))
-
-    # Compress with raw deflate (no zlib header/trailer)
-    combined = padded_virtual + padded_physical
-    compressed = zlib.compress(combined, 6)[2:-4]
-
-    header = struct.pack("<4I", 0x37435352, 13, virtual_flags, physical_flags)
-    return header + compressed
-
-
-def _encode_rsc7_flags(size: int) -> int:
-    """Encode a segment size into RSC7 flags.
-
-    RSC7 flags use base_size = 0x200 << ss, where ss = bits 0-3.
-    Pages are encoded in bits 4-27 as a weighted sum:
-      s0 (bit27)=1x, s1 (bit26)=2x, s2 (bit25)=4x, s3 (bit24)=8x,
-      s4 (bits17-23)=16x, ...
-    Total size = base_size * (s0+s1+s2+s3+s4+...).
-    """
-    if size == 0:
-        return 0
-
-    # Use ss=0 → base_size=512. Compute pages needed.
-    base_size = 0x200  # 512
-    pages = (size + base_size - 1) // base_size
-
-    # Encode pages into s0-s3 (bits 27-24) for pages <= 15
-    # and s4 (bits 17-23) for the 16x multiplier
-    flags = 0
-    remainder = pages
-
-    # s4: bits 17-23, value * 16 pages (0-127)
-    s4_val = min(remainder // 16, 127)
-    remainder -= s4_val * 16
-    flags |= (s4_val << 17)
-
-    # s3: bit 24, 8 pages
-    if remainder >= 8:
-        flags |= (1 << 24)
-        remainder -= 8
-    # s2: bit 25, 4 pages
-    if remainder >= 4:
-        flags |= (1 << 25)
-        remainder -= 4
-    # s1: bit 26, 2 pages
-    if remainder >= 2:
-        flags |= (1 << 26)
-        remainder -= 2
-    # s0: bit 27, 1 page
-    if remainder >= 1:
-        flags |= (1 << 27)
-
-    return flags
+    """Build (once per distinct key) the bytes of a solid-color DXT1 .ytd."""
+    raw_data = make_dxt1_data(width, height, rgb)
+    return build_ytd_bytes(tex_name, width, height, raw_data)
 
 
 def _write_ytd_file(
     directory: str,
     filename: str,
     rgb: tuple[int, int, int] = (172, 135, 121),
-    width: int = 64,
-    height: int = 64,
+    width: int = 4,
+    height: int = 4,
 ) -> str:
-    """Write a synthetic .ytd file with a solid-color DXT1 texture."""
+    """Write a synthetic .ytd file with a solid-color DXT1 texture.
+
+    Defaults to a single 4x4 DXT1 block — the hash/opacity checks don't
+    depend on texture size, and a small texture keeps the deflate input
+    small.  Pass *width*/*height* explicitly where size matters.
+    """
     tex_name = filename.replace(".ytd", "")
-    raw_data = _make_dxt1_data(width, height, rgb)
-    ytd_bytes = _build_ytd_bytes(tex_name, width, height, raw_data)
+    ytd_bytes = _solid_ytd_bytes(tex_name, width, height, rgb)
     path = os.path.join(directory, filename)
-    with open(path, "wb") as f:
-        f.write(ytd_bytes)
+    # Small file: one unbuffered write instead of a buffered file object
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        os.write(fd, ytd_bytes)
+    finally:
+        os.close(fd)
     return path
 
 
@@ -201,48 +74,69 @@ def _write_ytd_file(
 # Tests for _texture_hash_and_opacity
 # ---------------------------------------------------------------------------
 
+def _solid_ytd_segments(
+    tex_name: str,
+    rgb: tuple[int, int, int] = (172, 135, 121),
+    width: int = 4,
+    height: int = 4,
+) -> tuple[bytes, bytes]:
+    """In-memory (virtual, physical) segments of a solid-color DXT1 .ytd."""
+    raw_data = make_dxt1_data(width, height, rgb)
+    return build_ytd_segments(tex_name, width, height, raw_data)
+
+
 class TestTextureHashAndOpacity:
     """Test the low-level hash + opacity extraction."""
 
-    def test_returns_hash_and_opacity_for_valid_ytd(self, tmp_path):
-        path = _write_ytd_file(str(tmp_path), "test_diff_000_a_uni.ytd")
-        result = _texture_hash_and_opacity(path)
+    def test_returns_hash_and_opacity_for_valid_ytd(self):
+        result = _texture_hash_and_opacity_from_parts(
+            *_solid_ytd_segments("test_diff_000_a_uni")
+        )
         assert result is not None
         md5, opacity = result
-        assert len(md5) == 32  # full MD5 hex
+        assert len(md5) == 32  # full 128-bit hex digest
         assert 0.0 <= opacity <= 1.0
 
-    def test_solid_color_is_fully_opaque(self, tmp_path):
+    def test_solid_color_is_fully_opaque(self):
         """DXT1 solid color = no alpha → 100% opaque."""
-        path = _write_ytd_file(str(tmp_path), "test_diff_000_a_uni.ytd",
-                               rgb=(172, 135, 121))
-        result = _texture_hash_and_opacity(path)
+        result = _texture_hash_and_opacity_from_parts(
+            *_solid_ytd_segments("test_diff_000_a_uni", rgb=(172, 135, 121))
+        )
         assert result is not None
         _, opacity = result
         assert opacity >= 0.95
 
-    def test_identical_textures_produce_same_hash(self, tmp_path):
+    def test_identical_textures_produce_same_hash(self):
         """Two .ytd files with the same pixel data should have the same hash."""
-        path_a = _write_ytd_file(str(tmp_path), "uppr_diff_000_a_whi.ytd",
-                                 rgb=(172, 135, 121))
-        path_b = _write_ytd_file(str(tmp_path), "uppr_diff_001_a_whi.ytd",
-                                 rgb=(172, 135, 121))
-        result_a = _texture_hash_and_opacity(path_a)
-        result_b = _texture_hash_and_opacity(path_b)
+        result_a = _texture_hash_and_opacity_from_parts(
+            *_solid_ytd_segments("uppr_diff_000_a_whi", rgb=(172, 135, 121))
+        )
+        result_b = _texture_hash_and_opacity_from_parts(
+            *_solid_ytd_segments("uppr_diff_001_a_whi", rgb=(172, 135, 121))
+        )
         assert result_a is not None and result_b is not None
         assert result_a[0] == result_b[0]  # same hash
 
-    def test_different_textures_produce_different_hash(self, tmp_path):
+    def test_different_textures_produce_different_hash(self):
         """Different pixel data → different hash."""
-        path_a = _write_ytd_file(str(tmp_path), "uppr_diff_000_a_whi.ytd",
-                                 rgb=(172, 135, 121))
-        path_b = _write_ytd_file(str(tmp_path), "uppr_diff_001_a_uni.ytd",
-                                 rgb=(30, 30, 30))
-        result_a = _texture_hash_and_opacity(path_a)
-        result_b = _texture_hash_and_opacity(path_b)
+        result_a = _texture_hash_and_opacity_from_parts(
+            *_solid_ytd_segments("uppr_diff_000_a_whi", rgb=(172, 135, 121))
+        )
+        result_b = _texture_hash_and_opacity_from_parts(
+            *_solid_ytd_segments("uppr_diff_001_a_uni", rgb=(30, 30, 30))
+        )
         assert result_a is not None and result_b is not None
         assert result_a[0] != result_b[0]
 
+    def test_file_matches_in_memory_segments(self, tmp_path):
+        """The file-path wrapper and the segment API agree."""
+        path = _write_ytd_file(str(tmp_path), "test_diff_000_a_uni.ytd")
+        assert _texture_hash_and_opacity(path) == (
+            _texture_hash_and_opacity_from_parts(
+                *_solid_ytd_segments("test_diff_000_a_uni")
+            )
+        )
+
     def test_returns_none_for_nonexistent_file(self):
         result = _texture_hash_and_opacity("/nonexistent/path.ytd")
         assert result is None
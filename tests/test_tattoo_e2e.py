@@ -5,8 +5,8 @@ on real tattoo .ytd files from stream/new_overlays/.
 """
 
 import os
-import tempfile
 
+import numpy as np
 import pytest
 from PIL import Image
 
@@ -24,7 +24,8 @@ TATTOO_FILES = [
 ]
 
 
-@pytest.fixture(params=TATTOO_FILES, ids=lambda p: os.path.basename(p))
+@pytest.fixture(scope="module", params=TATTOO_FILES,
+                ids=lambda p: os.path.basename(p))
 def tattoo_path(request):
     path = request.param
     if not os.path.isfile(path):
@@ -32,7 +33,7 @@ def tattoo_path(request):
     return path
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tattoo_texture(tattoo_path):
     """Extract the diffuse texture from a tattoo .ytd file."""
     rsc = parse_rsc7(tattoo_path)
@@ -68,51 +69,33 @@ class TestTattooExtraction:
         assert len(tattoo_texture.raw_data) > 0
 
 
+@pytest.fixture(scope="class")
+def rendered_webp(tattoo_texture, tmp_path_factory):
+    """Run the DDS -> WebP transcode once per tattoo for the rendering tests."""
+    out_path = str(tmp_path_factory.mktemp("tattoo") / "render.webp")
+    process_texture(build_dds(tattoo_texture), out_path)
+    return out_path
+
+
 class TestTattooRendering:
-    def test_produces_webp(self, tattoo_texture):
-        dds = build_dds(tattoo_texture)
-        with tempfile.NamedTemporaryFile(suffix=".webp", delete=False) as f:
-            out_path = f.name
-        try:
-            w, h = process_texture(dds, out_path)
-            assert os.path.isfile(out_path)
-            assert os.path.getsize(out_path) > 100  # Not an empty file
-        finally:
-            os.unlink(out_path)
-
-    def test_webp_is_512x512(self, tattoo_texture):
-        dds = build_dds(tattoo_texture)
-        with tempfile.NamedTemporaryFile(suffix=".webp", delete=False) as f:
-            out_path = f.name
-        try:
-            process_texture(dds, out_path)
-            img = Image.open(out_path)
+    def test_produces_webp(self, rendered_webp):
+        assert os.path.isfile(rendered_webp)
+        assert os.path.getsize(rendered_webp) > 100  # Not an empty file
+
+    def test_webp_is_512x512(self, rendered_webp):
+        with Image.open(rendered_webp) as img:
             assert img.size == (512, 512)
-            img.close()
-        finally:
-            os.unlink(out_path)
-
-    def test_webp_not_empty(self, tattoo_texture):
-        dds = build_dds(tattoo_texture)
-        with tempfile.NamedTemporaryFile(suffix=".webp", delete=False) as f:
-            out_path = f.name
-        try:
-            process_texture(dds, out_path)
-            assert is_image_empty(out_path) is False
-        finally:
-            os.unlink(out_path)
-
-    def test_webp_has_visible_pixels(self, tattoo_texture):
-        dds = build_dds(tattoo_texture)
-        with tempfile.NamedTemporaryFile(suffix=".webp", delete=False) as f:
-            out_path = f.name
-        try:
-            process_texture(dds, out_path)
-            img = Image.open(out_path).convert("RGBA")
+
+    def test_webp_not_empty(self, rendered_webp):
+        assert is_image_empty(rendered_webp) is False
+
+    def test_webp_has_visible_pixels(self, rendered_webp):
+        with Image.open(rendered_webp) as img:
+            # Output WebPs are RGBA already; only convert if that changes
+            if img.mode != "RGBA":
+                img = img.convert("RGBA")
             alpha = img.getchannel("A")
-            visible = sum(1 for p in alpha.tobytes() if p > 0)
-            assert visible > 500, (
-                f"Tattoo render has only {visible} visible pixels"
-            )
-        finally:
-            os.unlink(out_path)
+        visible = int(np.count_nonzero(np.asarray(alpha)))
+        assert visible > 500, (
+            f"Tattoo render has only {visible} visible pixels"
+        )
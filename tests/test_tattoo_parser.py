@@ -2,6 +2,7 @@
 
 import tempfile
 import os
+import xml.etree.ElementTree as ET
 
 import pytest
 
@@ -9,6 +10,7 @@ from src.tattoo_parser import (
     parse_shop_tattoo_meta,
     parse_overlays_xml,
     build_tattoo_meta,
+    _iter_shop_items,
     _normalize_zone,
 )
 
@@ -91,6 +93,32 @@ class TestParseShopTattooMeta:
         with pytest.raises(ValueError, match="Expected <TattooShopItemArray>"):
             parse_shop_tattoo_meta(str(f))
 
+    def test_streamed_items_are_detached(self, tmp_path, monkeypatch):
+        """Consumed <Item> elements are removed from their parent."""
+        xml = (
+            "<TattooShopItemArray><TattooShopItems>"
+            + "".join(f"<Item><preset>tat_{i:03d}_M</preset></Item>" for i in range(3))
+            + "</TattooShopItems></TattooShopItemArray>"
+        )
+        f = tmp_path / "shop_tattoo.meta"
+        f.write_text(xml, encoding="utf-8")
+
+        seen = []
+        real_iterparse = ET.iterparse
+
+        def recording_iterparse(*args, **kwargs):
+            for event, elem in real_iterparse(*args, **kwargs):
+                seen.append(elem)
+                yield event, elem
+
+        monkeypatch.setattr(ET, "iterparse", recording_iterparse)
+        items = [item.findtext("preset") for item in _iter_shop_items(f)]
+
+        assert items == ["tat_000_M", "tat_001_M", "tat_002_M"]
+        root = seen[0]
+        assert root.tag == "TattooShopItemArray"
+        assert list(root.iter("Item")) == []
+
     def test_lenient_xml_with_stray_tag(self, tmp_path):
         """Handles XML with duplicate </Item> closing tags (real-world issue)."""
         xml = """<?xml version="1.0"?>
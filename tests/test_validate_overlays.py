@@ -0,0 +1,102 @@
+"""Tests for the face overlay validation tool (tools/validate_overlays.py)."""
+
+import json
+import pickle
+
+import pytest
+
+from tests.ytd_builders import build_ytd_bytes, make_dxt1_data
+from tools.validate_overlays import (
+    CACHE_FILENAME,
+    _CACHE_VERSION,
+    _cache_key,
+    load_cache,
+    main,
+    save_cache,
+    validate_ytd,
+)
+
+
+def _write_faov(tmp_path, name, width, height, raw_data, mip_levels=1):
+    path = tmp_path / name
+    path.write_bytes(build_ytd_bytes(name[:-4], width, height, raw_data,
+                                     mip_levels=mip_levels))
+    return path
+
+
+class TestValidateYtd:
+    def test_complete_texture_is_valid(self, tmp_path):
+        path = _write_faov(tmp_path, "mp_fm_faov_beard_000.ytd", 64, 64,
+                           make_dxt1_data(64, 64, (60, 45, 30)))
+        result = validate_ytd(path)
+        assert result.valid, result.error
+        assert result.diffuse_data_size == 64 * 64 // 2
+
+    def test_truncated_texture_is_invalid_without_deep(self, tmp_path):
+        """A 64x64 DXT1 texture with only 512 of 2048 bytes must be rejected."""
+        path = _write_faov(tmp_path, "mp_fm_faov_beard_001.ytd", 64, 64,
+                           make_dxt1_data(32, 32, (60, 45, 30)))
+        result = validate_ytd(path)
+        assert result.valid is False
+        assert "truncated" in result.error
+
+    def test_missing_lower_mips_is_valid(self, tmp_path):
+        """Only the top mip is decoded, so a short mip chain is still valid."""
+        path = _write_faov(tmp_path, "mp_fm_faov_beard_002.ytd", 64, 64,
+                           make_dxt1_data(64, 64, (60, 45, 30)), mip_levels=7)
+        for deep in (False, True):
+            result = validate_ytd(path, deep=deep)
+            assert result.valid, result.error
+
+
+class TestResultCache:
+    def _entries(self, tmp_path):
+        path = _write_faov(tmp_path, "mp_fm_faov_beard_000.ytd", 64, 64,
+                           make_dxt1_data(64, 64, (60, 45, 30)))
+        result = validate_ytd(path)
+        fields = {k: getattr(result, k) for k in result.__slots__ if k != "path"}
+        return {_cache_key(result): (False, fields)}
+
+    def test_round_trip(self, tmp_path):
+        entries = self._entries(tmp_path)
+        cache_path = tmp_path / CACHE_FILENAME
+        save_cache(cache_path, entries)
+        json.loads(cache_path.read_text(encoding="utf-8"))  # plain JSON on disk
+        assert load_cache(cache_path) == entries
+
+    def test_pickle_file_is_not_loaded(self, tmp_path):
+        """A planted pickle is treated as unreadable, never unpickled."""
+        cache_path = tmp_path / CACHE_FILENAME
+        cache_path.write_bytes(pickle.dumps({"version": _CACHE_VERSION, "entries": []}))
+        assert load_cache(cache_path) == {}
+
+    def test_malformed_entry_is_skipped(self, tmp_path):
+        entries = self._entries(tmp_path)
+        cache_path = tmp_path / CACHE_FILENAME
+        save_cache(cache_path, entries)
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+        data["entries"].append({"name": "x.ytd", "mtime_ns": 1, "size": 2,
+                                "deep": False, "fields": {"valid": "yes"}})
+        cache_path.write_text(json.dumps(data), encoding="utf-8")
+        assert load_cache(cache_path) == entries
+
+    @pytest.mark.parametrize("raw_entries", [5, None, "x", {}])
+    def test_non_list_entries_is_empty(self, tmp_path, raw_entries):
+        cache_path = tmp_path / CACHE_FILENAME
+        cache_path.write_text(
+            json.dumps({"version": _CACHE_VERSION, "entries": raw_entries}),
+            encoding="utf-8",
+        )
+        assert load_cache(cache_path) == {}
+
+    def test_invalid_results_are_not_cached(self, tmp_path, monkeypatch):
+        """A failure may be transient, so only valid results are persisted."""
+        good = _write_faov(tmp_path, "mp_fm_faov_beard_000.ytd", 64, 64,
+                           make_dxt1_data(64, 64, (60, 45, 30)))
+        _write_faov(tmp_path, "mp_fm_faov_beard_001.ytd", 64, 64,
+                    make_dxt1_data(32, 32, (60, 45, 30)))
+        monkeypatch.setattr("sys.argv", ["validate_overlays", str(tmp_path)])
+        main()
+
+        cached_names = {key[0] for key in load_cache(tmp_path / CACHE_FILENAME)}
+        assert cached_names == {good.name}
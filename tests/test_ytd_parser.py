@@ -1,6 +1,8 @@
 """Tests for YTD texture dictionary parser — diffuse texture selection."""
 
-from src.ytd_parser import TextureInfo, select_diffuse_texture
+from dataclasses import replace
+
+from src.ytd_parser import TextureInfo, select_diffuse_texture, top_mip_size
 
 
 def _make_texture(name: str = "diffuse", width: int = 1024, height: int = 1024,
@@ -64,3 +66,12 @@ class TestSelectDiffuseTexture:
         # Our parser uses .lower() so this should be excluded
         result = select_diffuse_texture([diffuse, normal])
         assert result is diffuse
+
+
+class TestTopMipSize:
+    def test_block_compressed(self):
+        tex = replace(_make_texture(width=64, height=64), format_code=0x31545844)
+        assert top_mip_size(tex) == 64 * 64 // 2  # DXT1: 8 bytes per 4x4 block
+
+    def test_unknown_format_returns_none(self):
+        assert top_mip_size(_make_texture()) is None
@@ -0,0 +1,189 @@
+"""Builders for minimal synthetic .ytd files used across the test suite.
+
+Shared as a plain module (imported as ``tests.ytd_builders``) so that test
+modules never import one another.
+"""
+
+import functools
+import struct
+import zlib
+
+from src.rsc7 import get_size_from_flags
+
+
+@functools.lru_cache(maxsize=32)
+def make_dxt1_data(width: int, height: int, rgb: tuple[int, int, int]) -> bytes:
+    """Create minimal DXT1-compressed data that decodes to a solid color.
+
+    DXT1 uses 4x4 pixel blocks, each 8 bytes:
+      - 2 bytes: color0 (RGB565)
+      - 2 bytes: color1 (RGB565)
+      - 4 bytes: index bits (all 0 → every pixel uses color0)
+    """
+    r, g, b = rgb
+    # Pack as RGB565 (5 bits R, 6 bits G, 5 bits B)
+    color565 = ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+    color_bytes = struct.pack("<H", color565)
+
+    block = color_bytes + color_bytes + b"\x00\x00\x00\x00"  # 8 bytes per block
+
+    blocks_x = max(1, (width + 3) // 4)
+    blocks_y = max(1, (height + 3) // 4)
+    return block * (blocks_x * blocks_y)
+
+
+def build_ytd_segments(
+    tex_name: str,
+    width: int,
+    height: int,
+    raw_data: bytes,
+    format_code: int = 0x31545844,  # DXT1
+    mip_levels: int = 1,
+) -> tuple[bytes, bytes]:
+    """Build the decompressed (virtual, physical) segments of a one-texture .ytd.
+
+    These are exactly what rsc7.parse_rsc7() hands back for the file that
+    build_ytd_bytes() writes, so parser tests can skip the deflate/disk
+    round-trip.
+    """
+    # --- Virtual segment (structs) ---
+    # TextureDictionary header: 64 bytes
+    # Texture pointer array: 8 bytes (one pointer)
+    # Texture struct: 144 bytes
+    # Texture name: variable
+
+    name_bytes = tex_name.encode("ascii") + b"\x00"
+    # Pad name to 4-byte alignment
+    while len(name_bytes) % 4 != 0:
+        name_bytes += b"\x00"
+
+    # Layout offsets within virtual segment:
+    DICT_OFFSET = 0           # TextureDictionary header (64 bytes)
+    PTR_ARRAY_OFFSET = 64     # Pointer array (8 bytes)
+    TEX_OFFSET = 72           # Texture struct (144 bytes)
+    NAME_OFFSET = 216         # Name string
+
+    virtual_size = NAME_OFFSET + len(name_bytes)
+    virtual = bytearray(virtual_size)
+
+    # TextureDictionary header
+    # 0x30: pointer to texture pointer array
+    textures_ptr = 0x50000000 + PTR_ARRAY_OFFSET
+    struct.pack_into("<Q", virtual, 0x30, textures_ptr)
+    # 0x38: count, 0x3A: capacity
+    struct.pack_into("<H", virtual, 0x38, 1)   # count = 1
+    struct.pack_into("<H", virtual, 0x3A, 1)   # capacity = 1
+
+    # Pointer array: one 64-bit pointer to the texture struct
+    tex_ptr = 0x50000000 + TEX_OFFSET
+    struct.pack_into("<Q", virtual, PTR_ARRAY_OFFSET, tex_ptr)
+
+    # Texture struct (144 bytes at TEX_OFFSET)
+    # 0x28: name pointer
+    name_ptr = 0x50000000 + NAME_OFFSET
+    struct.pack_into("<Q", virtual, TEX_OFFSET + 0x28, name_ptr)
+    # 0x50: width, 0x52: height
+    struct.pack_into("<H", virtual, TEX_OFFSET + 0x50, width)
+    struct.pack_into("<H", virtual, TEX_OFFSET + 0x52, height)
+    # 0x56: stride
+    struct.pack_into("<H", virtual, TEX_OFFSET + 0x56, width)
+    # 0x58: format code
+    struct.pack_into("<I", virtual, TEX_OFFSET + 0x58, format_code)
+    # 0x5D: mip levels
+    virtual[TEX_OFFSET + 0x5D] = mip_levels
+    # 0x70: data pointer (into physical segment at offset 0)
+    data_ptr = 0x60000000
+    struct.pack_into("<Q", virtual, TEX_OFFSET + 0x70, data_ptr)
+
+    # Name string
+    virtual[NAME_OFFSET:NAME_OFFSET + len(name_bytes)] = name_bytes
+
+    # --- Physical segment (pixel data) ---
+    physical = bytes(raw_data)
+
+    # Pad segments to match the sizes that get_size_from_flags() returns.
+    # The parser uses flag-derived sizes to split the decompressed data.
+    virt_padded_size = get_size_from_flags(_encode_rsc7_flags(len(virtual)))
+    phys_padded_size = get_size_from_flags(_encode_rsc7_flags(len(physical)))
+
+    padded_virtual = bytes(virtual) + b"\x00" * (virt_padded_size - len(virtual))
+    padded_physical = physical + b"\x00" * (phys_padded_size - len(physical))
+    return padded_virtual, padded_physical
+
+
+def build_ytd_bytes(
+    tex_name: str,
+    width: int,
+    height: int,
+    raw_data: bytes,
+    format_code: int = 0x31545844,  # DXT1
+    mip_levels: int = 1,
+) -> bytes:
+    """Build a minimal RSC7 .ytd resource with one texture.
+
+    This creates a valid RSC7 file that rsc7.parse_rsc7() can decompress
+    and ytd_parser.parse_texture_dictionary() can parse.
+    """
+    padded_virtual, padded_physical = build_ytd_segments(
+        tex_name, width, height, raw_data, format_code, mip_levels,
+    )
+
+    # --- RSC7 container ---
+    # Padded sizes are whole pages, so they encode to the same flags
+    virtual_flags = _encode_rsc7_flags(len(padded_virtual))
+    physical_flags = _encode_rsc7_flags(len(padded_physical))
+
+    # Compress with raw deflate (no zlib header/trailer).  Level 1: the
+    # ratio is irrelevant here and the padding is mostly zeros anyway
+    combined = padded_virtual + padded_physical
+    co = zlib.compressobj(1, zlib.DEFLATED, -15)
+    compressed = co.compress(combined) + co.flush()
+
+    header = struct.pack("<4I", 0x37435352, 13, virtual_flags, physical_flags)
+    return header + compressed
+
+
+@functools.lru_cache(maxsize=16)
+def _encode_rsc7_flags(size: int) -> int:
+    """Encode a segment size into RSC7 flags.
+
+    RSC7 flags use base_size = 0x200 << ss, where ss = bits 0-3.
+    Pages are encoded in bits 4-27 as a weighted sum:
+      s0 (bit27)=1x, s1 (bit26)=2x, s2 (bit25)=4x, s3 (bit24)=8x,
+      s4 (bits17-23)=16x, ...
+    Total size = base_size * (s0+s1+s2+s3+s4+...).
+    """
+    if size == 0:
+        return 0
+
+    # Use ss=0 → base_size=512. Compute pages needed.
+    base_size = 0x200  # 512
+    pages = (size + base_size - 1) // base_size
+
+    # Encode pages into s0-s3 (bits 27-24) for pages <= 15
+    # and s4 (bits 17-23) for the 16x multiplier
+    flags = 0
+    remainder = pages
+
+    # s4: bits 17-23, value * 16 pages (0-127)
+    s4_val = min(remainder // 16, 127)
+    remainder -= s4_val * 16
+    flags |= (s4_val << 17)
+
+    # s3: bit 24, 8 pages
+    if remainder >= 8:
+        flags |= (1 << 24)
+        remainder -= 8
+    # s2: bit 25, 4 pages
+    if remainder >= 4:
+        flags |= (1 << 25)
+        remainder -= 4
+    # s1: bit 26, 2 pages
+    if remainder >= 2:
+        flags |= (1 << 26)
+        remainder -= 2
+    # s0: bit 27, 1 page
+    if remainder >= 1:
+        flags |= (1 << 27)
+
+    return flags
@@ -20,24 +20,40 @@ Usage:
     python tools/validate_overlays.py overlays/
     python tools/validate_overlays.py overlays/ --types beard eyebrowf eyebrowm
     python tools/validate_overlays.py overlays/ --clean   # actually delete/rename
+    python tools/validate_overlays.py overlays/ --deep    # also decode every DDS
+
+Results are cached in overlays/.validate_cache.json keyed on each file's
+name, mtime and size, so re-runs only revalidate changed files
+(--no-cache to bypass).
 """
 from __future__ import annotations
 
 import argparse
 import hashlib
+import json
 import logging
+import os
 import re
 import sys
-from collections import defaultdict
-from dataclasses import dataclass, field
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from functools import partial
+from io import BytesIO
 from pathlib import Path
 
+from PIL import Image
+
 # Add project root to path so we can import src modules
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.rsc7 import parse_rsc7                                    # noqa: E402
-from src.ytd_parser import parse_texture_dictionary, select_diffuse_texture  # noqa: E402
+from src.ytd_parser import (                                       # noqa: E402
+    parse_texture_dictionary,
+    select_diffuse_texture,
+    top_mip_size,
+)
 from src.dds_builder import build_dds                               # noqa: E402
 
 logger = logging.getLogger(__name__)
@@ -53,31 +69,46 @@ _FAOV_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Windows-style duplicate suffix added on extraction, e.g. "(2)"
+_DUP_SUFFIX_RE = re.compile(r'\(\d+\)')
+
+# Literal start of every name _FAOV_RE can match (compared lower-cased)
+_FAOV_PREFIX = "mp_fm_faov_"
+
 # Overlay types relevant for the clothing tool (user-facing categories)
 DEFAULT_TYPES = {"beard", "eyebrowf", "eyebrowm"}
 
+# ProcessPoolExecutor's limit on Windows (WaitForMultipleObjects cap)
+_WIN32_MAX_WORKERS = 61
+
+# Validation results from earlier runs, stored inside the overlays dir
+CACHE_FILENAME = ".validate_cache.json"
+_CACHE_VERSION = 6  # bump when cached fields or their meaning change
+
 
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class FileValidation:
     """Result of validating a single .ytd file."""
     path: Path
     valid: bool = False
     error: str = ""
     file_size: int = 0
+    mtime_ns: int = 0
     tex_count: int = 0
     diffuse_width: int = 0
     diffuse_height: int = 0
+    pixel_count: int = 0    # diffuse_width * diffuse_height
     diffuse_format: str = ""
-    diffuse_data_hash: str = ""
+    diffuse_data_hash: bytes = b""  # raw digest; hex only for display
     diffuse_data_size: int = 0
     can_decode_dds: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class OverlayGroup:
     """A group of files sharing the same base name (differing only by dup suffix)."""
     base_name: str          # e.g. mp_fm_faov_beard_000
@@ -92,9 +123,23 @@ class OverlayGroup:
 # Validation
 # ---------------------------------------------------------------------------
 
-def validate_ytd(path: Path) -> FileValidation:
-    """Run the full RSC7 → YTD → DDS pipeline on a single file."""
-    result = FileValidation(path=path, file_size=path.stat().st_size)
+def validate_ytd(
+    path: Path,
+    file_size: int | None = None,
+    hash_data: bool = True,
+    deep: bool = False,
+) -> FileValidation:
+    """Run the full RSC7 → YTD → DDS pipeline on a single file.
+
+    *file_size* can be passed when the caller already knows it (e.g. from
+    a directory scan) to skip the extra ``stat``.  *hash_data* can be
+    turned off for files with no duplicates to compare against, leaving
+    ``diffuse_data_hash`` empty.  With *deep*, the built DDS is also fully
+    decoded with Pillow; otherwise a successful DDS build is enough.
+    """
+    if file_size is None:
+        file_size = path.stat().st_size
+    result = FileValidation(path=path, file_size=file_size)
 
     # Step 1: RSC7 parse
     try:
@@ -123,9 +168,27 @@ def validate_ytd(path: Path) -> FileValidation:
 
     result.diffuse_width = diffuse.width
     result.diffuse_height = diffuse.height
+    result.pixel_count = diffuse.width * diffuse.height
     result.diffuse_format = diffuse.format_name
     result.diffuse_data_size = len(diffuse.raw_data)
-    result.diffuse_data_hash = hashlib.md5(diffuse.raw_data).hexdigest()
+
+    # The parser clamps short pixel data instead of failing, so a top mip
+    # too short to decode must be caught here; with --deep the Pillow
+    # decode below is the judge instead
+    if not deep:
+        expected = top_mip_size(diffuse)
+        if expected is not None and len(diffuse.raw_data) < expected:
+            result.error = (
+                f"YTD: diffuse data truncated "
+                f"({len(diffuse.raw_data)} of {expected} bytes)"
+            )
+            return result
+
+    # Only compared for equality within one run, so any fast digest will do
+    if hash_data:
+        result.diffuse_data_hash = hashlib.blake2b(
+            diffuse.raw_data, digest_size=16,
+        ).digest()
 
     # Step 4: DDS build (validates format is supported)
     try:
@@ -134,21 +197,172 @@ def validate_ytd(path: Path) -> FileValidation:
         result.error = f"DDS: {exc}"
         return result
 
-    # Step 5: Try to decode with Pillow
-    try:
-        from PIL import Image
-        from io import BytesIO
-        img = Image.open(BytesIO(dds_bytes))
-        img.load()  # force decode
-        result.can_decode_dds = True
-    except Exception as exc:
-        result.error = f"Pillow: {exc}"
-        return result
+    # Step 5: Try to decode with Pillow (--deep only; build_dds has
+    # already rejected unsupported formats and the size check above
+    # caught a truncated top mip)
+    if deep:
+        try:
+            img = Image.open(BytesIO(dds_bytes))
+            img.load()  # force decode
+            result.can_decode_dds = True
+        except Exception as exc:
+            result.error = f"Pillow: {exc}"
+            return result
 
     result.valid = True
     return result
 
 
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+# Cached FileValidation fields (everything except the path) and their types
+_CACHED_FIELD_TYPES: dict[str, type] = {
+    name: type(value)
+    for name, value in asdict(FileValidation(path=Path())).items()
+    if name != "path"
+}
+
+
+def _cache_key(fv: FileValidation) -> tuple[str, int, int]:
+    """Identity of a file version: name plus mtime and size from the scan."""
+    return (fv.path.name, fv.mtime_ns, fv.file_size)
+
+
+def _encode_entry(key: tuple[str, int, int], entry: tuple[bool, dict]) -> dict:
+    """JSON-ready form of one cache entry (the hash digest is hex-encoded)."""
+    name, mtime_ns, size = key
+    was_deep, fields = entry
+    fields = dict(fields, diffuse_data_hash=fields["diffuse_data_hash"].hex())
+    return {"name": name, "mtime_ns": mtime_ns, "size": size,
+            "deep": was_deep, "fields": fields}
+
+
+def _decode_entry(raw: dict) -> tuple[tuple[str, int, int], tuple[bool, dict]]:
+    """Inverse of :func:`_encode_entry`; raises on anything malformed.
+
+    Every field must be present with the same type as the
+    :class:`FileValidation` default, so a hand-edited or foreign cache
+    can't smuggle odd values into the report.
+    """
+    key = (raw["name"], raw["mtime_ns"], raw["size"])
+    if not (isinstance(key[0], str) and type(key[1]) is int and type(key[2]) is int):
+        raise ValueError("bad cache key")
+    was_deep = raw["deep"]
+    fields = dict(raw["fields"])
+    fields["diffuse_data_hash"] = bytes.fromhex(fields["diffuse_data_hash"])
+    if type(was_deep) is not bool or set(fields) != set(_CACHED_FIELD_TYPES):
+        raise ValueError("bad cache entry")
+    for name, value in fields.items():
+        if type(value) is not _CACHED_FIELD_TYPES[name]:
+            raise ValueError(f"bad cache field {name!r}")
+    return key, (was_deep, fields)
+
+
+def load_cache(cache_path: Path) -> dict[tuple[str, int, int], tuple[bool, dict]]:
+    """Load cached validation results; a missing or unreadable cache is empty.
+
+    The cache is plain JSON — it lives in the (possibly shared) overlays
+    directory, so it must never be able to run code when loaded.
+    """
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.debug("Ignoring unreadable cache %s: %s", cache_path, exc)
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+
+    raw_entries = data.get("entries")
+    if not isinstance(raw_entries, list):
+        return {}
+
+    entries: dict[tuple[str, int, int], tuple[bool, dict]] = {}
+    for raw in raw_entries:
+        try:
+            key, entry = _decode_entry(raw)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            logger.debug("Skipping malformed cache entry in %s", cache_path)
+            continue
+        entries[key] = entry
+    return entries
+
+
+def save_cache(
+    cache_path: Path,
+    entries: dict[tuple[str, int, int], tuple[bool, dict]],
+) -> None:
+    """Write cached validation results (best effort)."""
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    data = {
+        "version": _CACHE_VERSION,
+        "entries": [_encode_entry(key, entry) for key, entry in entries.items()],
+    }
+    try:
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.warning("Could not write cache %s: %s", cache_path, exc)
+
+
+def _cached_result(
+    entry: tuple[bool, dict] | None,
+    fv: FileValidation,
+    deep: bool,
+    hash_data: bool,
+) -> FileValidation | None:
+    """Rebuild a cached result for *fv*, or None if it can't answer this run.
+
+    A result is only reused when it was validated at least as thoroughly
+    as requested: a ``--deep`` run needs a deep result, and a file that
+    now has duplicates needs its diffuse hash.
+    """
+    if entry is None:
+        return None
+    was_deep, fields = entry
+    if deep and not was_deep:
+        return None
+    if hash_data and fields["valid"] and not fields["diffuse_data_hash"]:
+        return None
+    return FileValidation(path=fv.path, **fields)
+
+
+def _find_identical_copies(
+    groups: list[OverlayGroup],
+    files: list[FileValidation],
+    todo: list[int],
+) -> dict[int, int]:
+    """Map indices in *todo* to an earlier byte-identical file in the same group.
+
+    *files* is the flattened per-group file list.  Only files whose size
+    matches a sibling's are read and hashed.
+    """
+    group_of = [gi for gi, g in enumerate(groups) for _ in g.files]
+    same_size: dict[tuple[int, int], list[int]] = defaultdict(list)
+    for i in todo:
+        same_size[(group_of[i], files[i].file_size)].append(i)
+
+    copy_of: dict[int, int] = {}
+    for candidates in same_size.values():
+        if len(candidates) < 2:
+            continue
+        first_by_digest: dict[bytes, int] = {}
+        for i in candidates:
+            try:
+                data = files[i].path.read_bytes()
+            except OSError:
+                continue  # let validate_ytd report it
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            rep = first_by_digest.setdefault(digest, i)
+            if rep != i:
+                copy_of[i] = rep
+    return copy_of
+
+
 # ---------------------------------------------------------------------------
 # Grouping
 # ---------------------------------------------------------------------------
@@ -160,11 +374,17 @@ def discover_and_group(
     """Scan directory, match faov files, group by base name."""
     groups: dict[str, OverlayGroup] = {}
 
-    for f in sorted(overlays_dir.iterdir()):
-        if not f.is_file():
+    # scandir entries carry the file type (and on Windows the size) from
+    # the directory read itself, saving a stat per file
+    with os.scandir(overlays_dir) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    for entry in entries:
+        # Cheap prefix test skips unrelated files before the regex runs
+        if entry.name[:len(_FAOV_PREFIX)].lower() != _FAOV_PREFIX:
             continue
-        m = _FAOV_RE.match(f.name)
-        if not m:
+        m = _FAOV_RE.match(entry.name)
+        if not m or not entry.is_file():
             continue
 
         overlay_type = m.group("type")
@@ -185,7 +405,12 @@ def discover_and_group(
             )
 
         # Placeholder — validation happens next
-        groups[key].files.append(FileValidation(path=f))
+        st = entry.stat()
+        groups[key].files.append(FileValidation(
+            path=overlays_dir / entry.name,
+            file_size=st.st_size,
+            mtime_ns=st.st_mtime_ns,
+        ))
 
     return sorted(groups.values(), key=lambda g: (g.overlay_type, g.index, g.channel))
 
@@ -194,6 +419,13 @@ def discover_and_group(
 # Selection logic
 # ---------------------------------------------------------------------------
 
+def _hashes_all_equal(files: list[FileValidation]) -> bool:
+    """True if all *files* share one diffuse hash; stops at the first mismatch."""
+    it = iter(files)
+    first = next(it).diffuse_data_hash
+    return all(f.diffuse_data_hash == first for f in it)
+
+
 def pick_winner(group: OverlayGroup) -> None:
     """Among valid files in a group, pick the best one.
 
@@ -213,8 +445,7 @@ def pick_winner(group: OverlayGroup) -> None:
         return
 
     # Check if all valid files have identical diffuse data
-    hashes = {f.diffuse_data_hash for f in valid}
-    if len(hashes) == 1:
+    if _hashes_all_equal(valid):
         # All identical — pick the base (no parentheses) if available, else first
         base_file = next((f for f in valid if "(" not in f.path.name), None)
         group.winner = base_file or valid[0]
@@ -224,7 +455,7 @@ def pick_winner(group: OverlayGroup) -> None:
     group.winner = max(
         valid,
         key=lambda f: (
-            f.diffuse_width * f.diffuse_height,
+            f.pixel_count,
             f.diffuse_data_size,
             f.file_size,
         ),
@@ -237,101 +468,115 @@ def pick_winner(group: OverlayGroup) -> None:
 
 def print_report(groups: list[OverlayGroup], verbose: bool = False) -> None:
     """Print a human-readable validation report."""
-    total_files = sum(len(g.files) for g in groups)
+    out: list[str] = []  # written to stdout in one go at the end
+
+    # Gather every statistic in a single pass over groups/files
+    total_files = 0
+    total_valid = 0
+    total_dupes = 0
+    diffuse_groups: list[OverlayGroup] = []
+    normal_groups: list[OverlayGroup] = []
+    spec_groups: list[OverlayGroup] = []
+    invalid_files: list[tuple[OverlayGroup, FileValidation]] = []
+    differing: list[OverlayGroup] = []
+    to_delete: list[Path] = []
+    to_rename: list[tuple[Path, Path]] = []
+
+    for g in groups:
+        total_files += len(g.files)
+        total_dupes += max(0, len(g.files) - 1)
+
+        if not g.channel:
+            diffuse_groups.append(g)
+        elif g.channel == "_n":
+            normal_groups.append(g)
+        elif g.channel == "_s":
+            spec_groups.append(g)
+
+        valid: list[FileValidation] = []
+        for f in g.files:
+            if f.valid:
+                valid.append(f)
+            else:
+                invalid_files.append((g, f))
+            if f is not g.winner:
+                to_delete.append(f.path)
+        total_valid += len(valid)
+
+        # Groups where duplicates differ
+        if len(valid) > 1 and not _hashes_all_equal(valid):
+            differing.append(g)
+
+        # If winner has a (N) suffix, it should be renamed to the base name
+        if g.winner and "(" in g.winner.path.name:
+            clean_name = _DUP_SUFFIX_RE.sub('', g.winner.path.name)
+            to_rename.append((g.winner.path, g.winner.path.parent / clean_name))
+
     total_groups = len(groups)
-    total_valid = sum(1 for g in groups for f in g.files if f.valid)
     total_invalid = total_files - total_valid
-    total_dupes = sum(max(0, len(g.files) - 1) for g in groups)
-
-    # Only diffuse groups (no _n/_s)
-    diffuse_groups = [g for g in groups if not g.channel]
-    normal_groups = [g for g in groups if g.channel == "_n"]
-    spec_groups = [g for g in groups if g.channel == "_s"]
-
-    print(f"\n{'='*70}")
-    print(f"  Face Overlay Validation Report")
-    print(f"{'='*70}")
-    print(f"  Total files scanned:     {total_files}")
-    print(f"  Unique overlays (groups): {total_groups}")
-    print(f"    Diffuse:  {len(diffuse_groups)}")
-    print(f"    Normal:   {len(normal_groups)}")
-    print(f"    Specular: {len(spec_groups)}")
-    print(f"  Valid files:             {total_valid}")
-    print(f"  Invalid/corrupt files:   {total_invalid}")
-    print(f"  Duplicate files:         {total_dupes}")
+
+    out.append(f"\n{'='*70}")
+    out.append(f"  Face Overlay Validation Report")
+    out.append(f"{'='*70}")
+    out.append(f"  Total files scanned:     {total_files}")
+    out.append(f"  Unique overlays (groups): {total_groups}")
+    out.append(f"    Diffuse:  {len(diffuse_groups)}")
+    out.append(f"    Normal:   {len(normal_groups)}")
+    out.append(f"    Specular: {len(spec_groups)}")
+    out.append(f"  Valid files:             {total_valid}")
+    out.append(f"  Invalid/corrupt files:   {total_invalid}")
+    out.append(f"  Duplicate files:         {total_dupes}")
 
     # Breakdown by type
-    type_counts: dict[str, int] = defaultdict(int)
-    for g in diffuse_groups:
-        if g.winner:
-            type_counts[g.overlay_type] += 1
-    print(f"\n  Usable diffuse textures by type:")
+    type_counts = Counter(g.overlay_type for g in diffuse_groups if g.winner)
+    out.append(f"\n  Usable diffuse textures by type:")
     for t in sorted(type_counts):
-        print(f"    {t:15s}  {type_counts[t]:3d}")
+        out.append(f"    {t:15s}  {type_counts[t]:3d}")
 
     # Invalid files
-    invalid_files = [(g, f) for g in groups for f in g.files if not f.valid]
     if invalid_files:
-        print(f"\n{'-'*70}")
-        print(f"  INVALID FILES ({len(invalid_files)}):")
-        print(f"{'-'*70}")
+        out.append(f"\n{'-'*70}")
+        out.append(f"  INVALID FILES ({len(invalid_files)}):")
+        out.append(f"{'-'*70}")
         for g, f in invalid_files:
-            print(f"  {f.path.name}")
-            print(f"    Error: {f.error}")
+            out.append(f"  {f.path.name}")
+            out.append(f"    Error: {f.error}")
 
     # Groups where duplicates differ
-    differing = [
-        g for g in groups
-        if len([f for f in g.files if f.valid]) > 1
-        and len({f.diffuse_data_hash for f in g.files if f.valid}) > 1
-    ]
     if differing:
-        print(f"\n{'-'*70}")
-        print(f"  GROUPS WITH DIFFERING CONTENT ({len(differing)}):")
-        print(f"{'-'*70}")
+        out.append(f"\n{'-'*70}")
+        out.append(f"  GROUPS WITH DIFFERING CONTENT ({len(differing)}):")
+        out.append(f"{'-'*70}")
         for g in differing:
-            print(f"\n  {g.base_name}:")
+            out.append(f"\n  {g.base_name}:")
             for f in g.files:
                 status = "VALID" if f.valid else "BROKEN"
                 winner = " << WINNER" if f is g.winner else ""
                 res = f"{f.diffuse_width}x{f.diffuse_height}" if f.valid else "n/a"
                 fmt = f.diffuse_format if f.valid else "n/a"
-                h = f.diffuse_data_hash[:8] if f.valid else "n/a"
-                print(f"    {f.path.name:50s} [{status}] {res:>10s} {fmt:>6s} hash={h}{winner}")
+                h = f.diffuse_data_hash.hex()[:8] if f.valid else "n/a"
+                out.append(f"    {f.path.name:50s} [{status}] {res:>10s} {fmt:>6s} hash={h}{winner}")
 
     if verbose:
-        print(f"\n{'-'*70}")
-        print(f"  ALL GROUPS:")
-        print(f"{'-'*70}")
+        out.append(f"\n{'-'*70}")
+        out.append(f"  ALL GROUPS:")
+        out.append(f"{'-'*70}")
         for g in groups:
             n_valid = sum(1 for f in g.files if f.valid)
             n_total = len(g.files)
             winner_name = g.winner.path.name if g.winner else "NONE"
-            print(f"  {g.base_name:45s}  {n_valid}/{n_total} valid  winner={winner_name}")
+            out.append(f"  {g.base_name:45s}  {n_valid}/{n_total} valid  winner={winner_name}")
 
     # Summary of what to clean
-    to_delete = []
-    to_rename = []
-    for g in groups:
-        if not g.winner:
-            to_delete.extend(f.path for f in g.files)
-            continue
-        for f in g.files:
-            if f is not g.winner:
-                to_delete.append(f.path)
-        # If winner has a (N) suffix, it should be renamed to the base name
-        if "(" in g.winner.path.name:
-            clean_name = re.sub(r'\(\d+\)', '', g.winner.path.name)
-            to_rename.append((g.winner.path, g.winner.path.parent / clean_name))
-
-    print(f"\n{'-'*70}")
-    print(f"  CLEANUP SUMMARY:")
-    print(f"{'-'*70}")
-    print(f"  Files to delete: {len(to_delete)}")
-    print(f"  Files to rename: {len(to_rename)}")
-    print(f"  Run with --clean to apply changes")
-    print(f"{'='*70}\n")
-
+    out.append(f"\n{'-'*70}")
+    out.append(f"  CLEANUP SUMMARY:")
+    out.append(f"{'-'*70}")
+    out.append(f"  Files to delete: {len(to_delete)}")
+    out.append(f"  Files to rename: {len(to_rename)}")
+    out.append(f"  Run with --clean to apply changes")
+    out.append(f"{'='*70}\n")
+
+    sys.stdout.write("\n".join(out) + "\n")
     return to_delete, to_rename
 
 
@@ -369,6 +614,14 @@ def main() -> None:
     )
     parser.add_argument("--all-types", action="store_true", help="Process all overlay types")
     parser.add_argument("--clean", action="store_true", help="Actually delete/rename files")
+    parser.add_argument(
+        "--deep", action="store_true",
+        help="Also fully decode each DDS with Pillow (slower)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"Revalidate every file instead of reusing {CACHE_FILENAME}",
+    )
     parser.add_argument("--verbose", "-v", action="store_true", help="Show all groups")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
@@ -398,16 +651,86 @@ def main() -> None:
     total = sum(len(g.files) for g in groups)
     print(f"Validating {total} files across {len(groups)} groups...")
 
-    done = 0
+    placeholders = [fv for g in groups for fv in g.files]
+    # Hashes are only compared within a group, so singletons skip hashing
+    hash_flags = [len(g.files) > 1 for g in groups for _ in g.files]
+
+    # Reuse results for files unchanged since the last run
+    cache_path = args.overlays_dir / CACHE_FILENAME
+    cache = {} if args.no_cache else load_cache(cache_path)
+    results: list[FileValidation | None] = [
+        _cached_result(cache.get(_cache_key(fv)), fv, args.deep, want_hash)
+        for fv, want_hash in zip(placeholders, hash_flags)
+    ]
+    todo = [i for i, r in enumerate(results) if r is None]
+    done = total - len(todo)
+    if done:
+        print(f"  {done} unchanged files reused from cache")
+
+    # (N) copies are often byte-identical to a sibling — validate those once
+    copy_of = _find_identical_copies(groups, placeholders, todo)
+    todo = [i for i in todo if i not in copy_of]
+
+    # Files are independent and CPU-bound — validate across processes
+    # Each worker re-imports this script and src/ (always on Windows, where
+    # processes are spawned), so start no more workers than there are
+    # chunks of work — and none at all when everything came from cache
+    chunksize = 4
+    workers = min(os.cpu_count() or 1, -(-len(todo) // chunksize))
+    if sys.platform == "win32":
+        # ProcessPoolExecutor rejects max_workers > 61 on Windows
+        workers = min(workers, _WIN32_MAX_WORKERS)
+    if workers:
+        validate = partial(validate_ytd, deep=args.deep)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            validated = executor.map(
+                validate,
+                [placeholders[i].path for i in todo],
+                [placeholders[i].file_size for i in todo],
+                [hash_flags[i] for i in todo],
+                chunksize=chunksize,
+            )
+            for i, result in zip(todo, validated):
+                result.mtime_ns = placeholders[i].mtime_ns
+                results[i] = result
+                done += 1
+                if done % 20 == 0 or done == total:
+                    print(f"  [{done}/{total}]", end="\r")
+
+    for i, rep in copy_of.items():
+        results[i] = replace(
+            results[rep],
+            path=placeholders[i].path,
+            mtime_ns=placeholders[i].mtime_ns,
+        )
+    if copy_of:
+        print(f"  [{total}/{total}]  ({len(copy_of)} identical copies)", end="\r")
+
+    if not args.no_cache:
+        # Keep entries for files outside this run's --types so switching
+        # types doesn't discard them; drop stale versions and removed files
+        validated_names = {r.path.name for r in results}
+        present = set(os.listdir(args.overlays_dir))
+        entries = {
+            key: entry for key, entry in cache.items()
+            if key[0] in present and key[0] not in validated_names
+        }
+        # Only valid results are cached: a failure may be transient (a file
+        # locked by OpenIV, a permission error) and must be re-checked
+        # rather than remembered and acted on by --clean
+        for r in results:
+            if not r.valid:
+                continue
+            fields = asdict(r)
+            del fields["path"]
+            entries[_cache_key(r)] = (args.deep or r.can_decode_dds, fields)
+        save_cache(cache_path, entries)
+
+    # Scatter results back into their groups (map preserves order)
+    offset = 0
     for g in groups:
-        validated = []
-        for fv in g.files:
-            result = validate_ytd(fv.path)
-            validated.append(result)
-            done += 1
-            if done % 20 == 0 or done == total:
-                print(f"  [{done}/{total}]", end="\r")
-        g.files = validated
+        g.files = results[offset:offset + len(g.files)]
+        offset += len(g.files)
         pick_winner(g)
 
     print()  # clear progress line